@@ -4,6 +4,9 @@ import sqlite3
 import os
 from datetime import datetime
 
+# cash_inventory 'type' for every peso denomination the kiosk handles
+CASH_TYPES = {d: ('bill' if d >= 20 else 'coin') for d in (1, 5, 10, 20, 50, 100, 200, 500, 1000)}
+
 class DatabaseManager:
     def __init__(self, db_name="ssp_database.db"):
         # Use the same database file as models.py
@@ -25,6 +28,19 @@ class DatabaseManager:
             print(f"❌ Database connection error: {e}")
             self.conn = None
 
+    def enable_write_ahead_log(self):
+        """
+        Switches the database to WAL so the writer thread's commits do not block
+        readers on other connections, with synchronous=NORMAL (one fsync per
+        checkpoint rather than per commit) on this connection.
+        """
+        if not self.conn: return
+        try:
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute("PRAGMA synchronous=NORMAL")
+        except sqlite3.Error as e:
+            print(f"Error enabling WAL mode: {e}")
+
     def close(self):
         """Close the database connection."""
         if self.conn:
@@ -76,18 +92,31 @@ class DatabaseManager:
             print(f"Error updating setting '{key}': {e}")
 
     # --- Existing Methods (assuming they are here) ---
+    INSERT_TRANSACTION_SQL = """
+        INSERT INTO transactions (timestamp, file_name, pages, copies, color_mode, total_cost, amount_paid, change_given, status, error_message)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """
+    SET_CASH_INVENTORY_SQL = "INSERT OR REPLACE INTO cash_inventory (denomination, count, type, last_updated) VALUES (?, ?, ?, ?)"
+    # Applies a signed count change; params are (denomination, change, type, time, change)
+    ADD_CASH_INVENTORY_SQL = """
+        INSERT INTO cash_inventory (denomination, count, type, last_updated) VALUES (?, MAX(0, ?), ?, ?)
+        ON CONFLICT(denomination) DO UPDATE SET
+            count = MAX(0, count + ?), type = excluded.type, last_updated = excluded.last_updated
+    """
+
+    @staticmethod
+    def _transaction_params(data):
+        return (
+            datetime.now(), data['file_name'], data['pages'], data['copies'], data['color_mode'],
+            data['total_cost'], data['amount_paid'], data['change_given'], data['status'],
+            data.get('error_message', None)
+        )
+
     def log_transaction(self, data):
         if not self.conn: return
         try:
             cursor = self.conn.cursor()
-            cursor.execute("""
-                INSERT INTO transactions (timestamp, file_name, pages, copies, color_mode, total_cost, amount_paid, change_given, status, error_message)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                datetime.now(), data['file_name'], data['pages'], data['copies'], data['color_mode'],
-                data['total_cost'], data['amount_paid'], data['change_given'], data['status'],
-                data.get('error_message', None)
-            ))
+            cursor.execute(self.INSERT_TRANSACTION_SQL, self._transaction_params(data))
             self.conn.commit()
         except sqlite3.Error as e:
             print(f"Error logging transaction: {e}")
@@ -130,6 +159,42 @@ class DatabaseManager:
         except sqlite3.Error as e:
             print(f"Error updating cash inventory: {e}")
 
+    def log_transaction_and_add_cash(self, txn_data, cash_counts):
+        """
+        Logs a transaction and applies {denomination: count} changes to the cash
+        inventory: positive for cash received, negative for change paid out.
+        The counts are adjusted in SQL (never below zero), so nothing is read
+        first and both parts share one commit. txn_data may be None.
+        """
+        if not self.conn: return
+        try:
+            now = datetime.now()
+            with self.conn:
+                cursor = self.conn.cursor()
+                if txn_data:
+                    cursor.execute(self.INSERT_TRANSACTION_SQL, self._transaction_params(txn_data))
+                cursor.executemany(
+                    self.ADD_CASH_INVENTORY_SQL,
+                    [(denomination, count, CASH_TYPES[denomination], now, count)
+                     for denomination, count in cash_counts.items() if count]
+                )
+        except sqlite3.Error as e:
+            print(f"Error logging transaction and cash: {e}")
+
+    def update_cash_inventory_bulk(self, rows):
+        """Sets several inventory counts at once from (denomination, count, type) rows."""
+        if not self.conn or not rows: return
+        try:
+            now = datetime.now()
+            cursor = self.conn.cursor()
+            cursor.executemany(
+                self.SET_CASH_INVENTORY_SQL,
+                [(denomination, count, type, now) for denomination, count, type in rows]
+            )
+            self.conn.commit()
+        except sqlite3.Error as e:
+            print(f"Error updating cash inventory: {e}")
+
     def get_cash_inventory(self):
         if not self.conn: 
             print("❌ ERROR: No database connection for get_cash_inventory")
@@ -16,7 +16,7 @@ import os
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from PyQt5.QtWidgets import QApplication, QMainWindow, QStackedWidget, QDesktopWidget
-from PyQt5.QtCore import Qt, QTimer
+from PyQt5.QtCore import Qt, QTimer, QThreadPool
 from PyQt5.QtGui import QIcon
 from screens.idle import IdleController
 from screens.usb import USBController
@@ -39,6 +39,8 @@ try:
 except Exception as e:
     print(f"❌ Failed to import USBFileManager: {e}")
 
+from utils.debug import DEBUG as _DEBUG
+
 
 class PrintingSystemApp(QMainWindow):
     """
@@ -77,6 +79,9 @@ class PrintingSystemApp(QMainWindow):
         # Initialize stacked widget for screen management
         self.stacked_widget = QStackedWidget()
         self.setCentralWidget(self.stacked_widget)
+        
+        # Set by the payment screen once a job is paid for; cleared after printing
+        self.current_print_job = None
 
         # Initialize all screen controllers
         self.idle_screen = IdleController(self)
@@ -160,15 +165,18 @@ class PrintingSystemApp(QMainWindow):
         self.show_screen('idle')
         
         # Connect printer manager signals immediately after initialization
-        print("DEBUG: Connecting printer manager signals after initialization")
+        if _DEBUG:
+            print("DEBUG: Connecting printer manager signals after initialization")
         from PyQt5.QtCore import Qt
         self.printer_manager.print_job_successful.connect(self.on_print_successful, Qt.QueuedConnection)
         self.printer_manager.print_job_failed.connect(self.on_print_failed, Qt.QueuedConnection)
         self.printer_manager.print_job_waiting.connect(self.on_print_waiting, Qt.QueuedConnection)
-        print("DEBUG: Printer manager signals connected successfully with QueuedConnection")
+        if _DEBUG:
+            print("DEBUG: Printer manager signals connected successfully with QueuedConnection")
         
         # Signal connection established successfully
-        print("DEBUG: Signal connection established successfully")
+        if _DEBUG:
+            print("DEBUG: Signal connection established successfully")
 
         # Apply application-wide styles
         self.setStyleSheet("""
@@ -273,13 +281,16 @@ class PrintingSystemApp(QMainWindow):
         
         # Call on_enter lifecycle method for new screen
         new_widget = self.stacked_widget.currentWidget()
-        print(f"DEBUG: show_screen - new_widget: {new_widget}")
-        print(f"DEBUG: show_screen - hasattr(new_widget, 'on_enter'): {hasattr(new_widget, 'on_enter')}")
+        if _DEBUG:
+            print(f"DEBUG: show_screen - new_widget: {new_widget}")
+            print(f"DEBUG: show_screen - hasattr(new_widget, 'on_enter'): {hasattr(new_widget, 'on_enter')}")
         if hasattr(new_widget, 'on_enter'):
-            print(f"DEBUG: show_screen - calling new_widget.on_enter()")
+            if _DEBUG:
+                print(f"DEBUG: show_screen - calling new_widget.on_enter()")
             try:
                 new_widget.on_enter()
-                print(f"DEBUG: show_screen - new_widget.on_enter() completed")
+                if _DEBUG:
+                    print(f"DEBUG: show_screen - new_widget.on_enter() completed")
             except Exception as e:
                 print(f"ERROR: show_screen - new_widget.on_enter() failed with error: {e}")
                 import traceback
@@ -318,20 +329,23 @@ class PrintingSystemApp(QMainWindow):
         If not currently on the thank you screen, navigates to it first.
         """
         print("✅ Print job successfully completed")
-        print(f"DEBUG: on_print_successful called, about to trigger ink analysis")
-        
-        # Log transaction to database after successful printing
-        if hasattr(self, 'payment_screen') and self.payment_screen and hasattr(self.payment_screen.model, 'log_transaction_after_print_success'):
-            print("DEBUG: Logging transaction after successful print")
-            self.payment_screen.model.log_transaction_after_print_success()
-        
-        # Update database immediately after print success (don't wait for ink analysis)
-        print(f"DEBUG: Updating database immediately after print success")
+        if _DEBUG:
+            print(f"DEBUG: on_print_successful called, about to trigger ink analysis")
+        
+        # Update database immediately after print success (don't wait for ink analysis).
+        # The transaction log and the cash inventory change share one commit.
+        if _DEBUG:
+            print(f"DEBUG: Updating database immediately after print success")
+        cash_changes = self._cash_changes_after_print()
+        if self.payment_screen is not None:
+            if _DEBUG:
+                print("DEBUG: Logging transaction after successful print")
+            self.payment_screen.model.log_transaction_after_print_success(cash_changes)
         self._update_paper_count_after_print()
-        self._update_coin_inventory_after_print()
         
         # Clear the print job after successful completion to prevent re-printing
-        print(f"DEBUG: Clearing current_print_job after successful completion")
+        if _DEBUG:
+            print(f"DEBUG: Clearing current_print_job after successful completion")
         self.current_print_job = None
         
         # Trigger ink analysis for the printed job (if print job info available)
@@ -357,8 +371,9 @@ class PrintingSystemApp(QMainWindow):
         
         After analysis completes, the temporary PDF is cleaned up.
         """
-        print(f"DEBUG: _trigger_ink_analysis called")
-        if not hasattr(self, 'current_print_job') or not self.current_print_job:
+        if _DEBUG:
+            print(f"DEBUG: _trigger_ink_analysis called")
+        if not self.current_print_job:
             print("⚠️ No print job info available for ink analysis")
             return
         
@@ -392,7 +407,8 @@ class PrintingSystemApp(QMainWindow):
         Args:
             operation: InkAnalysisOperation object with result or error
         """
-        print(f"DEBUG: _on_ink_analysis_completed called with operation: {operation}")
+        if _DEBUG:
+            print(f"DEBUG: _on_ink_analysis_completed called with operation: {operation}")
         
         # Handle both dictionary and object formats
         if isinstance(operation, dict):
@@ -408,7 +424,8 @@ class PrintingSystemApp(QMainWindow):
                 if result.get('success', False) and result.get('database_updated', False):
                     print("✅ Ink levels updated in database")
         
-        print(f"DEBUG: Ink analysis completed, database updates already done after print success")
+        if _DEBUG:
+            print(f"DEBUG: Ink analysis completed, database updates already done after print success")
         
         # Always clean up temp PDF after analysis completes
         self.printer_manager.cleanup_last_temp_pdf()
@@ -420,7 +437,7 @@ class PrintingSystemApp(QMainWindow):
         This method is called after ink analysis completes, ensuring that
         paper count is only decremented after the print job actually succeeds.
         """
-        if not hasattr(self, 'current_print_job') or not self.current_print_job:
+        if not self.current_print_job:
             print("⚠️ No print job info available for paper count update")
             return
         
@@ -431,26 +448,30 @@ class PrintingSystemApp(QMainWindow):
             total_pages = len(selected_pages) * copies
             
             print(f"📄 Updating paper count: -{total_pages} pages (pages: {len(selected_pages)}, copies: {copies})")
-            print(f"DEBUG: current_print_job details: {self.current_print_job}")
+            if _DEBUG:
+                print(f"DEBUG: current_print_job details: {self.current_print_job}")
             
             # Use direct database access instead of async threader
-            if hasattr(self, 'admin_screen') and self.admin_screen:
+            if self.admin_screen is not None:
                 # Get current paper count
                 current_count = self.admin_screen.get_paper_count()
                 if current_count is not None:
                     new_count = max(0, current_count - total_pages)
                     
                     # Update paper count directly through admin screen
-                    print(f"DEBUG: Calling decrement_paper_count with {total_pages} pages")
+                    if _DEBUG:
+                        print(f"DEBUG: Calling decrement_paper_count with {total_pages} pages")
                     success = self.admin_screen.model.decrement_paper_count(total_pages)
-                    print(f"DEBUG: decrement_paper_count returned: {success}")
+                    if _DEBUG:
+                        print(f"DEBUG: decrement_paper_count returned: {success}")
                     
                     if success:
                         print(f"✅ Paper count updated: {current_count} -> {new_count}")
                         
                         # Verify the update by checking the database again
                         updated_count = self.admin_screen.get_paper_count()
-                        print(f"DEBUG: Verified paper count in database: {updated_count}")
+                        if _DEBUG:
+                            print(f"DEBUG: Verified paper count in database: {updated_count}")
                         
                         # Check for low paper alert (only send once)
                         if new_count <= 10 and not self.low_paper_alert_sent:
@@ -469,93 +490,55 @@ class PrintingSystemApp(QMainWindow):
         except Exception as e:
             print(f"❌ Error updating paper count: {e}")
 
-    def _update_coin_inventory_after_print(self):
+    def _cash_changes_after_print(self):
         """
-        Update coin inventory after successful printing.
+        Compute the cash inventory changes for a successful print.
         
         This method handles BOTH:
         1. Adding received coins (coins inserted during payment)
         2. Subtracting dispensed change (coins given as change)
         
-        This ensures the database reflects the actual coins in the system.
+        Returns:
+            Dictionary of {denomination: signed count change}. The database
+            thread applies it relative to the stored counts, in the same commit
+            as the transaction log, so no stale count is ever written back.
         """
-        if not hasattr(self, 'current_print_job') or not self.current_print_job:
+        if not self.current_print_job:
             print("⚠️ No print job info available for coin inventory update")
-            return
+            return {}
         
         try:
-            print(f"DEBUG: Starting coin inventory update for print job: {self.current_print_job}")
+            if _DEBUG:
+                print(f"DEBUG: Starting coin inventory update for print job: {self.current_print_job}")
             
             # Get payment info from the payment model if available
-            if hasattr(self, 'payment_screen') and self.payment_screen:
-                payment_model = self.payment_screen.model
-                
-                # Handle received coins (coins inserted during payment)
-                if hasattr(payment_model, 'cash_received') and payment_model.cash_received:
-                    print(f"💰 Adding received coins to inventory: {payment_model.cash_received}")
-                    self._update_coin_inventory_items(payment_model.cash_received, add=True)
-                
-                # Handle dispensed change (coins given as change)
-                if hasattr(payment_model, 'change_dispensed') and payment_model.change_dispensed:
-                    print(f"💰 Subtracting dispensed change from inventory: {payment_model.change_dispensed}")
-                    self._update_coin_inventory_items(payment_model.change_dispensed, add=False)
-                else:
-                    print("DEBUG: No change dispensed data available")
-                    
-            else:
+            if self.payment_screen is None:
                 print("⚠️ No payment screen available for coin inventory update")
+                return {}
+            payment_model = self.payment_screen.model
+            
+            # Handle received coins (coins inserted during payment)
+            cash_received = payment_model.cash_received_counts()
+            if cash_received:
+                print(f"💰 Adding received coins to inventory: {cash_received}")
+            
+            # Handle dispensed change (coins given as change)
+            change_dispensed = payment_model.change_dispensed
+            if change_dispensed:
+                print(f"💰 Subtracting dispensed change from inventory: {change_dispensed}")
+            elif _DEBUG:
+                print("DEBUG: No change dispensed data available")
+            
+            changes = {}
+            for denomination in set(cash_received) | set(change_dispensed):
+                delta = cash_received.get(denomination, 0) - change_dispensed.get(denomination, 0)
+                if delta:
+                    changes[denomination] = delta
+            return changes
                 
         except Exception as e:
             print(f"❌ Error updating coin inventory: {e}")
-
-    def _update_coin_inventory_items(self, coin_data, add=True):
-        """
-        Update coin inventory with specific coin data.
-        
-        Args:
-            coin_data: Dictionary of {denomination: count} 
-            add: True to add coins, False to subtract coins
-        """
-        if not hasattr(self, 'admin_screen') or not self.admin_screen:
-            print("⚠️ No admin screen available for coin inventory update")
-            return
-            
-        try:
-            print(f"DEBUG: Admin screen available, updating coin inventory")
-            for denomination, count in coin_data.items():
-                if count > 0:
-                    is_bill = denomination >= 20
-                    operation = "Adding" if add else "Subtracting"
-                    print(f"DEBUG: {operation} {count} x {denomination} {'bill' if is_bill else 'coin'}")
-                    
-                    # Get current count
-                    current_inventory = self.admin_screen.model.db_manager.get_cash_inventory()
-                    current_count = 0
-                    
-                    for item in current_inventory:
-                        if (item.get('denomination') == denomination and 
-                            item.get('type') == ('bill' if is_bill else 'coin')):
-                            current_count = item.get('count', 0)
-                            break
-                    
-                    # Calculate new count
-                    if add:
-                        new_count = current_count + count
-                    else:
-                        new_count = max(0, current_count - count)  # Don't go below 0
-                    
-                    # Update database
-                    self.admin_screen.model.db_manager.update_cash_inventory(
-                        denomination=denomination,
-                        count=new_count,
-                        type='bill' if is_bill else 'coin'
-                    )
-                    
-                    operation_symbol = "+" if add else "-"
-                    print(f"✅ Updated {denomination} {'bill' if is_bill else 'coin'}: {current_count} {operation_symbol}{count} = {new_count}")
-                    
-        except Exception as e:
-            print(f"❌ Error updating coin inventory items: {e}")
+            return {}
 
     def on_print_waiting(self):
         """
@@ -644,6 +627,10 @@ class PrintingSystemApp(QMainWindow):
             print("🔄 Cleaning up SMS system...")
             cleanup_sms()
             
+            # Release the change hoppers (the dispenser lives for the whole session)
+            print("🔄 Cleaning up change dispenser...")
+            self.payment_screen.model.close()
+            
             # Clean up persistent GPIO last
             print("🔄 Cleaning up persistent GPIO...")
             cleanup_persistent_gpio()
@@ -680,6 +667,8 @@ def main():
         app = QApplication(sys.argv) # Main thread init
         app.setApplicationName("Printing System GUI")
         app.setApplicationVersion("1.0")
+        # Preview thumbnails render in parallel on the global pool
+        QThreadPool.globalInstance().setMaxThreadCount(min(4, os.cpu_count() or 1))
         window = PrintingSystemApp()
 
         # Show window (size and mode determined by _setup_display)
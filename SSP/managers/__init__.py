@@ -8,12 +8,13 @@ except ImportError as e:
     PrinterManager = None
 
 try:
-    from .hopper_manager import HopperController, ChangeDispenser, DispenseThread, PIGPIO_AVAILABLE
+    from .hopper_manager import HopperController, ChangeDispenser, DispenseSignals, DispenseTask, PIGPIO_AVAILABLE
 except ImportError as e:
     print(f"Warning: Could not import hopper_manager classes: {e}")
     HopperController = None
     ChangeDispenser = None
-    DispenseThread = None
+    DispenseSignals = None
+    DispenseTask = None
     PIGPIO_AVAILABLE = False
 
 try:
@@ -32,7 +33,8 @@ __all__ = [
     'PrinterManager',
     'HopperController',
     'ChangeDispenser',
-    'DispenseThread',
+    'DispenseSignals',
+    'DispenseTask',
     'PIGPIO_AVAILABLE',
     'get_sms_manager',
     'USBFileManager'
@@ -60,6 +60,8 @@ class DatabaseThreadManager(QObject):
     coin_count_updated = pyqtSignal(int, int)
     operation_completed = pyqtSignal(str, bool)
     
+    STOP_TIMEOUT = 10.0  # seconds to let queued writes drain on shutdown
+    
     def __init__(self):
         """Initialize the database thread manager."""
         super().__init__()
@@ -76,15 +78,15 @@ class DatabaseThreadManager(QObject):
             self.thread.start()
     
     def stop(self):
-        """Stop the database worker thread."""
+        """Stop the database worker thread once every queued operation has run."""
         self.running = False
         if self.thread and self.thread.is_alive():
-            self.thread.join(timeout=1.0)
-        
-        # Close database connection if it exists
-        if hasattr(self, 'db_manager') and self.db_manager:
-            self.db_manager.close()
-            print("Database connection closed in thread manager")
+            # The sentinel goes behind any queued writes; the worker closes its
+            # own connection after processing it
+            self.operation_queue.put(None)
+            self.thread.join(timeout=self.STOP_TIMEOUT)
+            if self.thread.is_alive():
+                print("⚠️ Database worker still busy after stop timeout")
     
     def _database_worker(self):
         """
@@ -94,11 +96,16 @@ class DatabaseThreadManager(QObject):
         """
         # Create database manager in this thread (for thread safety)
         self.db_manager = DatabaseManager()
+        self.db_manager.enable_write_ahead_log()
         
-        while self.running:
+        # Runs until the stop sentinel, so operations queued before stop() are kept
+        while True:
+            operation = None
             try:
-                # Get operation from queue with timeout
-                operation = self.operation_queue.get(timeout=0.1)
+                # Sleep until an operation (or the stop sentinel) arrives
+                operation = self.operation_queue.get()
+                if operation is None:
+                    break
                 
                 # Route operation to appropriate handler
                 if operation.operation_type == "get_cmyk_levels":
@@ -115,6 +122,8 @@ class DatabaseThreadManager(QObject):
                     self._handle_update_coin_counts(operation)
                 elif operation.operation_type == "update_coin_inventory":
                     self._handle_update_coin_inventory(operation)
+                elif operation.operation_type == "log_transaction_and_add_cash":
+                    self._handle_log_transaction_and_add_cash(operation)
                 else:
                     operation.error = f"Unknown operation type: {operation.operation_type}"
                 
@@ -122,8 +131,6 @@ class DatabaseThreadManager(QObject):
                 if operation.callback:
                     operation.callback(operation)
                     
-            except queue.Empty:
-                continue
             except Exception as e:
                 print(f"❌ Error in database worker: {e}")
                 
@@ -137,6 +144,10 @@ class DatabaseThreadManager(QObject):
                 if operation and operation.callback:
                     operation.error = str(e)
                     operation.callback(operation)
+        
+        # The connection belongs to this thread, so close it here
+        self.db_manager.close()
+        print("Database connection closed in thread manager")
     
     def _handle_get_cmyk_levels(self, operation):
         """Retrieve CMYK ink levels from database."""
@@ -232,24 +243,19 @@ class DatabaseThreadManager(QObject):
             coins_1 = operation.data['coins_1']
             coins_5 = operation.data['coins_5']
             
-            # Get current inventory
+            # Subtract in SQL (clamped at 0) so writes queued before this one are kept
+            self.db_manager.log_transaction_and_add_cash(None, {1: -coins_1, 5: -coins_5})
+            
+            # Read back the new counts
             inventory = self.db_manager.get_cash_inventory()
-            current_1 = 0
-            current_5 = 0
+            new_1 = 0
+            new_5 = 0
             
             for item in inventory:
                 if item['denomination'] == 1 and item['type'] == 'coin':
-                    current_1 = item['count']
+                    new_1 = item['count']
                 elif item['denomination'] == 5 and item['type'] == 'coin':
-                    current_5 = item['count']
-            
-            # Calculate new counts (prevent negative)
-            new_1 = max(0, current_1 - coins_1)
-            new_5 = max(0, current_5 - coins_5)
-            
-            # Update inventory
-            self.db_manager.update_cash_inventory(1, new_1, 'coin')
-            self.db_manager.update_cash_inventory(5, new_5, 'coin')
+                    new_5 = item['count']
             
             operation.result = {'coins_1': new_1, 'coins_5': new_5}
             self.operation_completed.emit("update_coin_inventory", True)
@@ -257,6 +263,18 @@ class DatabaseThreadManager(QObject):
             operation.error = str(e)
             print(f"❌ Error updating coin inventory: {e}")
     
+    def _handle_log_transaction_and_add_cash(self, operation):
+        """Log a transaction and apply cash inventory changes in one commit."""
+        try:
+            self.db_manager.log_transaction_and_add_cash(
+                operation.data['transaction'], operation.data['cash_counts']
+            )
+            operation.result = True
+            self.operation_completed.emit("log_transaction_and_add_cash", True)
+        except Exception as e:
+            operation.error = str(e)
+            print(f"❌ Error logging transaction and cash: {e}")
+    
     # Public methods for queuing operations
     
     def get_cmyk_levels(self, callback=None):
@@ -340,6 +358,25 @@ class DatabaseThreadManager(QObject):
         self.operation_queue.put(operation)
         return operation
     
+    def log_transaction_and_add_cash(self, transaction_data, cash_counts, callback=None):
+        """
+        Queue operation to log a transaction and apply cash inventory changes.
+        
+        Args:
+            transaction_data: Transaction dict for the transactions table, or None
+            cash_counts: Dictionary of {denomination: count}; positive counts are
+                added, negative counts (change paid out) are subtracted
+            callback: Optional callback function(operation)
+            
+        Returns:
+            DatabaseOperation object
+        """
+        operation = DatabaseOperation("log_transaction_and_add_cash", {
+            'transaction': transaction_data, 'cash_counts': cash_counts
+        }, callback)
+        self.operation_queue.put(operation)
+        return operation
+    
     def get_coin_counts(self, callback=None):
         """
         Queue operation to get coin counts.
@@ -1,7 +1,8 @@
 # screens/hopper_manager.py
 
 import time
-from PyQt5.QtCore import QThread, pyqtSignal
+import threading
+from PyQt5.QtCore import QObject, QRunnable, pyqtSignal
 
 # --- Check for pigpio and set a flag ---
 try:
@@ -12,6 +13,8 @@ except ImportError:
     PIGPIO_AVAILABLE = False
     print("WARNING: pigpio library not found. Hopper control will be SIMULATED.")
 
+from utils.debug import DEBUG as _DEBUG
+
 
 # --- General Configuration ---
 COIN_DELAY = 1.0         # Delay after a successful dispense before next one
@@ -312,8 +315,11 @@ class ChangeDispenser:
             print(f"Error reinitializing hoppers: {e}")
             return False
 
-    def dispense_change(self, amount: float, status_callback=None, admin_screen=None, db_threader=None):
-        """Calculates and dispenses the correct change, one coin at a time. Returns actual coins dispensed."""
+    def dispense_change(self, amount: float, status_callback=None, admin_screen=None, db_threader=None, should_stop=None):
+        """
+        Calculates and dispenses the correct change, one coin at a time. Returns actual coins dispensed.
+        should_stop, if given, is polled between coins; returning True ends dispensing early.
+        """
         if amount <= 0:
             return {'success': True, 'coins_1': 0, 'coins_5': 0}
 
@@ -348,6 +354,9 @@ class ChangeDispenser:
 
         # Dispense 5-peso coins
         for i in range(num_fives):
+            if should_stop and should_stop():
+                print(f"Dispensing interrupted after {actual_fives}/{num_fives} ₱5 coins")
+                break
             msg = f"Dispensing ₱5 coin ({i + 1} of {num_fives})"
             if status_callback: status_callback(msg)
             print(msg)
@@ -360,7 +369,8 @@ class ChangeDispenser:
 
             if success:
                 actual_fives += 1
-                print(f"DEBUG: Successfully dispensed ₱5 coin {actual_fives}/{num_fives}")
+                if _DEBUG:
+                    print(f"DEBUG: Successfully dispensed ₱5 coin {actual_fives}/{num_fives}")
             else:
                 error_msg = f"CRITICAL: Failed to dispense ₱5 coin {i + 1}. Dispensed {actual_fives}/{num_fives} so far."
                 if status_callback: status_callback(error_msg)
@@ -370,6 +380,9 @@ class ChangeDispenser:
 
         # Dispense 1-peso coins
         for i in range(num_ones):
+            if should_stop and should_stop():
+                print(f"Dispensing interrupted after {actual_ones}/{num_ones} ₱1 coins")
+                break
             msg = f"Dispensing ₱1 coin ({i + 1} of {num_ones})"
             if status_callback: status_callback(msg)
             print(msg)
@@ -382,7 +395,8 @@ class ChangeDispenser:
 
             if success:
                 actual_ones += 1
-                print(f"DEBUG: Successfully dispensed ₱1 coin {actual_ones}/{num_ones}")
+                if _DEBUG:
+                    print(f"DEBUG: Successfully dispensed ₱1 coin {actual_ones}/{num_ones}")
             else:
                 error_msg = f"CRITICAL: Failed to dispense ₱1 coin {i + 1}. Dispensed {actual_ones}/{num_ones} so far."
                 if status_callback: status_callback(error_msg)
@@ -394,6 +408,17 @@ class ChangeDispenser:
         actual_change = (actual_fives * 5) + (actual_ones * 1)
         expected_change = (num_fives * 5) + (num_ones * 1)
         
+        if should_stop and should_stop():
+            print(f"Dispensing cancelled after ₱{actual_change:.2f} of ₱{expected_change:.2f}")
+            return {
+                'success': False,
+                'coins_1': actual_ones,
+                'coins_5': actual_fives,
+                'actual_change': actual_change,
+                'expected_change': expected_change,
+                'error': 'cancelled'
+            }
+        
         final_msg = f"Change dispensing complete. Dispensed ₱{actual_change:.2f} (₱{actual_fives}x5 + ₱{actual_ones}x1) of ₱{expected_change:.2f} expected."
         if status_callback: status_callback(final_msg)
         print(final_msg)
@@ -406,6 +431,11 @@ class ChangeDispenser:
             'expected_change': expected_change
         }
     
+    def disable_all_hoppers(self):
+        """Turn every hopper motor off but keep the pigpio handles for the next dispense."""
+        for hopper in self.hoppers.values():
+            hopper._disable_hopper()
+
     def cleanup_all_hoppers(self):
         """Clean up all hopper controllers."""
         print("Cleaning up all hopper controllers...")
@@ -435,35 +465,60 @@ class ChangeDispenser:
                 self.pi = None
 
 
-class DispenseThread(QThread):
-    """A dedicated thread to run the dispensing logic without freezing the GUI."""
-    status_update = pyqtSignal(str)
-    dispensing_finished = pyqtSignal(dict)  # Changed to emit the full result dict
+class DispenseSignals(QObject):
+    """Signals for DispenseTask; QRunnable cannot emit on its own. Each carries the task."""
+    status_update = pyqtSignal(object, str)
+    dispensing_finished = pyqtSignal(object, dict)  # task, full result dict
+
 
-    def __init__(self, dispenser: ChangeDispenser, amount: float, admin_screen=None, db_threader=None):
+class DispenseTask(QRunnable):
+    """Runs the dispensing logic on a thread pool without freezing the GUI."""
+
+    def __init__(self, dispenser: ChangeDispenser, amount: float, signals: DispenseSignals,
+                 admin_screen=None, db_threader=None):
         super().__init__()
         self.dispenser = dispenser
         self.amount = amount
+        self.signals = signals
         self.admin_screen = admin_screen
         self.db_threader = db_threader
+        self._stop = threading.Event()
+        self._done = threading.Event()
+
+    def stop(self):
+        """Asks the dispense loop to finish after the coin in flight."""
+        self._stop.set()
+
+    def is_running(self):
+        """True until run() has returned (including while queued on the pool)."""
+        return not self._done.is_set()
+
+    def wait(self, msecs):
+        """Blocks up to msecs for run() to return; returns True if it has."""
+        return self._done.wait(msecs / 1000)
+
+    def _status(self, message):
+        self.signals.status_update.emit(self, message)
 
     def run(self):
-        """This method is executed when the thread starts."""
-        if self.dispenser is None:
-            print("ERROR: Dispenser is None, cannot dispense change")
-            result = {
-                'success': False, 
-                'coins_1': 0, 
-                'coins_5': 0, 
-                'error': 'dispenser_not_available'
-            }
-            self.dispensing_finished.emit(result)
-            return
-            
-        result = self.dispenser.dispense_change(
-            self.amount, 
-            self.status_update.emit, 
-            self.admin_screen, 
-            self.db_threader
-        )
-        self.dispensing_finished.emit(result)
\ No newline at end of file
+        """This method is executed on a pool thread."""
+        try:
+            if self.dispenser is None:
+                print("ERROR: Dispenser is None, cannot dispense change")
+                result = {
+                    'success': False, 
+                    'coins_1': 0, 
+                    'coins_5': 0, 
+                    'error': 'dispenser_not_available'
+                }
+            else:
+                result = self.dispenser.dispense_change(
+                    self.amount, 
+                    self._status, 
+                    self.admin_screen, 
+                    self.db_threader,
+                    should_stop=self._stop.is_set
+                )
+            self.signals.dispensing_finished.emit(self, result)
+        finally:
+            self._done.set()
@@ -81,9 +81,11 @@ class PaymentAlgorithmManager:
         
         return {1: coins_1, 5: coins_5}
     
-    def can_dispense_change(self, change_amount: float) -> Tuple[bool, str, Dict[int, int]]:
+    def can_dispense_change(self, change_amount: float,
+                            coin_inventory: Optional[Dict[int, int]] = None) -> Tuple[bool, str, Dict[int, int]]:
         """
         Check if the system can dispense the required change.
+        Pass coin_inventory when checking many amounts against one inventory read.
         Returns: (can_dispense, reason, required_coins)
         """
         if change_amount <= 0:
@@ -92,7 +94,8 @@ class PaymentAlgorithmManager:
         # No artificial cap here; feasibility is determined by inventory below
         
         # Get current coin inventory
-        coin_inventory = self.get_coin_inventory()
+        if coin_inventory is None:
+            coin_inventory = self.get_coin_inventory()
         
         # Calculate required coins
         required_coins = self.calculate_change_breakdown(change_amount)
@@ -155,7 +158,7 @@ class PaymentAlgorithmManager:
             # Find amounts that result in change we can dispense
             for change_amount in range(1, min(int(max_change_amount) + 1, 21)):  # Up to ₱20 change
                 payment_amount = total_cost + change_amount
-                can_dispense, reason, required_coins = self.can_dispense_change(change_amount)
+                can_dispense, reason, required_coins = self.can_dispense_change(change_amount, coin_inventory)
                 
                 if can_dispense:
                     suggestions.append({
@@ -171,7 +174,7 @@ class PaymentAlgorithmManager:
             if bill > total_cost:
                 change_amount = bill - total_cost
                 if change_amount <= max_change_amount:
-                    can_dispense, reason, required_coins = self.can_dispense_change(change_amount)
+                    can_dispense, reason, required_coins = self.can_dispense_change(change_amount, coin_inventory)
                     if can_dispense:
                         suggestions.append({
                             'amount': bill,
@@ -219,7 +222,7 @@ class PaymentAlgorithmManager:
         while the machine can still dispense the change, given current hopper coins.
 
         Logic:
-        - Determine the maximum dispensable change by testing from dynamic inventory limit down to 0
+        - Determine the maximum dispensable change directly from the spendable P1/P5 coins
         - Compute a ceiling = floor(total_cost) + max_feasible_change
         - From accepted denominations [1, 5, 10, 20, 50, 100], choose the largest
           denomination A such that total_cost <= A <= ceiling and change (A - total_cost) is feasible
@@ -231,18 +234,18 @@ class PaymentAlgorithmManager:
         th1 = self.MIN_COIN_THRESHOLDS.get(1, 0)
         available_5 = max(0, coin_inventory.get(5, 0) - (th5 if th5 > 0 else 0))
         available_1 = max(0, coin_inventory.get(1, 0) - (th1 if th1 > 0 else 0))
-        max_possible_change = int((available_5 * 5) + available_1)
 
-        best_change = 0
-        best_required: Dict[int, int] = {1: 0, 5: 0}
+        # Change is paid greedily (as many P5 as possible, then P1), so an amount c
+        # is feasible iff c // 5 <= available_5 and c % 5 <= available_1. Any amount
+        # above 5 * available_5 + min(available_1, 4) breaks one of the two, so that
+        # is the largest feasible change; no need to test every amount downwards.
+        # can_dispense_change also refuses all change once any reserve is already short.
+        best_change = int(available_5 * 5 + min(available_1, 4))
+        if any(th > 0 and coin_inventory.get(denom, 0) < th
+               for denom, th in self.MIN_COIN_THRESHOLDS.items()):
+            best_change = 0
 
         base = int(round(total_cost))
-        for change in range(max_possible_change, -1, -1):
-            can, reason, req = self.can_dispense_change(change)
-            if can:
-                best_change = change
-                best_required = req
-                break
 
         # If no change is possible, return exact
         if best_change == 0:
@@ -266,7 +269,7 @@ class PaymentAlgorithmManager:
             change_needed = d - base
             if change_needed < 0:
                 continue
-            can, reason, req = self.can_dispense_change(change_needed)
+            can, reason, req = self.can_dispense_change(change_needed, coin_inventory)
             if can:
                 chosen_amount = d
                 chosen_required = req
@@ -1,6 +1,5 @@
 # managers/persistent_gpio.py
 
-import time
 import threading
 from PyQt5.QtCore import QObject, pyqtSignal
 
@@ -12,6 +11,8 @@ except ImportError:
     PIGPIO_AVAILABLE = False
     print("WARNING: pigpio library not found. Persistent GPIO will be SIMULATED.")
 
+from utils.debug import DEBUG as _DEBUG
+
 class PersistentGPIO(QObject):
     """Singleton GPIO service that maintains a persistent pigpio connection."""
     
@@ -23,6 +24,22 @@ class PersistentGPIO(QObject):
     _instance = None
     _lock = threading.Lock()
     
+    # GPIO pins
+    COIN_PIN = 17
+    BILL_PIN = 18
+    INHIBIT_PIN = 23
+    COIN_INHIBIT_PIN = 22
+    
+    # Edges must hold this long (µs) before pigpio reports them; shorter than the
+    # narrowest acceptor pulse (~20 ms) so only contact bounce is dropped
+    GLITCH_FILTER_US = 10000
+    
+    # Pulse count -> peso value; the acceptors' pulse windows expanded into keys.
+    # GPIOPaymentThread in the payment screen reads these too.
+    COIN_PULSE_VALUES = {1: 1, **dict.fromkeys(range(5, 8), 5), **dict.fromkeys(range(10, 13), 10),
+                   **dict.fromkeys(range(18, 22), 20)}
+    BILL_PULSE_VALUES = {2: 20, 5: 50, 10: 100, 50: 500}
+    
     def __new__(cls):
         """Singleton pattern implementation."""
         if cls._instance is None:
@@ -39,22 +56,16 @@ class PersistentGPIO(QObject):
         self._initialized = True
         
         self.pi = None
+        self._pi_write = None
         self.gpio_available = PIGPIO_AVAILABLE
         self.enabled = False
         self.running = False
         
-        # GPIO pins
-        self.COIN_PIN = 17
-        self.BILL_PIN = 18
-        self.INHIBIT_PIN = 23
-        self.COIN_INHIBIT_PIN = 22
-        
         # Timing constants (matching original GPIOPaymentThread)
-        self.DEBOUNCE_TIME = 0.1   # Minimum time between pulses
         self.COIN_TIMEOUT = 0.5    # seconds without pulses = end of coin
         self.BILL_TIMEOUT = 0.5    # Time to wait for additional bill pulses (PULSE_TIMEOUT)
         
-        # State tracking
+        # State tracking (timestamps are pigpio edge ticks in µs)
         self.coin_pulse_count = 0
         self.coin_last_pulse_time = 0
         self.bill_pulse_count = 0
@@ -77,6 +88,8 @@ class PersistentGPIO(QObject):
             self.pi = pigpio.pi()
             if not self.pi.connected:
                 raise Exception("Could not connect to pigpio daemon")
+            # Bound once; the acceptor toggles call it on every enable/disable
+            self._pi_write = self.pi.write
             
             # Setup coin acceptor GPIO
             self.pi.set_mode(self.COIN_PIN, pigpio.INPUT)
@@ -94,6 +107,10 @@ class PersistentGPIO(QObject):
             self._set_acceptor_state(False)  # Start disabled
             self.bill_callback = self.pi.callback(self.BILL_PIN, pigpio.FALLING_EDGE, self._bill_pulse_detected)
             
+            # Debounce in the pigpio daemon so bounces never reach the Python callbacks
+            self.pi.set_glitch_filter(self.COIN_PIN, self.GLITCH_FILTER_US)
+            self.pi.set_glitch_filter(self.BILL_PIN, self.GLITCH_FILTER_US)
+            
             self.running = True
             self.payment_status.emit("Persistent GPIO ready - Coin and bill acceptors disabled")
             print("SUCCESS: Persistent GPIO initialized successfully")
@@ -104,47 +121,85 @@ class PersistentGPIO(QObject):
             print(f"ERROR: Persistent GPIO initialization failed: {e}")
     
     def _coin_pulse_detected(self, gpio, level, tick):
-        """Handle coin pulse detection."""
+        """Handle coin pulse detection (bounce is already filtered by pigpio)."""
+        if level == pigpio.TIMEOUT:
+            self._finalize_coin()
+            return
         if not self.enabled:
             return
             
-        current_time = time.time()
         with self._state_lock:
-            if current_time - self.coin_last_pulse_time > self.DEBOUNCE_TIME:
-                self.coin_pulse_count += 1
-                self.coin_last_pulse_time = current_time
-                print(f"Coin pulse detected: {self.coin_pulse_count}")
+            self.coin_pulse_count += 1
+            self.coin_last_pulse_time = tick
+        if _DEBUG:
+            print(f"Coin pulse detected: {self.coin_pulse_count}")
     
     def _bill_pulse_detected(self, gpio, level, tick):
-        """Handle bill pulse detection."""
+        """Handle bill pulse detection (bounce is already filtered by pigpio)."""
+        if level == pigpio.TIMEOUT:
+            self._finalize_bill()
+            return
         if not self.enabled:
             return
             
-        current_time = time.time()
         with self._state_lock:
-            if current_time - self.bill_last_pulse_time > self.DEBOUNCE_TIME:
-                self.bill_pulse_count += 1
-                self.bill_last_pulse_time = current_time
-                print(f"Bill pulse detected: {self.bill_pulse_count}")
+            self.bill_pulse_count += 1
+            self.bill_last_pulse_time = tick
+        if _DEBUG:
+            print(f"Bill pulse detected: {self.bill_pulse_count}")
+    
+    def _finalize_coin(self):
+        """Emits the coin for the pulses counted so far (pigpio watchdog fired)."""
+        with self._state_lock:
+            pulses, self.coin_pulse_count = self.coin_pulse_count, 0
+        if pulses:
+            coin_value = self._get_coin_value(pulses)
+            if coin_value > 0:
+                self.coin_inserted.emit(coin_value)
+                print(f"Coin processed: ₱{coin_value}")
+    
+    def _finalize_bill(self):
+        """Emits the bill for the pulses counted so far (pigpio watchdog fired)."""
+        with self._state_lock:
+            pulses, self.bill_pulse_count = self.bill_pulse_count, 0
+        if pulses:
+            bill_value = self._get_bill_value(pulses)
+            if bill_value > 0:
+                self.bill_inserted.emit(bill_value)
+                print(f"Bill processed: ₱{bill_value}")
+    
+    def _set_watchdogs(self, enable):
+        """
+        Arms pigpio watchdogs on the acceptor pins. After COIN_TIMEOUT/BILL_TIMEOUT
+        without an edge the callbacks receive pigpio.TIMEOUT and finalize the pulse
+        train, so nothing has to poll while payment is enabled.
+        """
+        if self.gpio_available and self.pi and self.pi.connected:
+            self.pi.set_watchdog(self.COIN_PIN, int(self.COIN_TIMEOUT * 1000) if enable else 0)
+            self.pi.set_watchdog(self.BILL_PIN, int(self.BILL_TIMEOUT * 1000) if enable else 0)
     
     def _set_acceptor_state(self, enable):
         """Enable or disable the bill acceptor."""
-        print(f"DEBUG: _set_acceptor_state called with enable={enable}")
+        if _DEBUG:
+            print(f"DEBUG: _set_acceptor_state called with enable={enable}")
         if self.gpio_available and self.pi and self.pi.connected:
             pin_value = 0 if enable else 1
-            print(f"DEBUG: Writing to INHIBIT_PIN {self.INHIBIT_PIN} with value {pin_value}")
-            self.pi.write(self.INHIBIT_PIN, pin_value)  # LOW = enabled, HIGH = disabled
+            if _DEBUG:
+                print(f"DEBUG: Writing to INHIBIT_PIN {self.INHIBIT_PIN} with value {pin_value}")
+            self._pi_write(self.INHIBIT_PIN, pin_value)  # LOW = enabled, HIGH = disabled
             print(f"Bill acceptor {'enabled' if enable else 'disabled'}")
         else:
             print(f"Bill acceptor {'enabled' if enable else 'disabled'} (simulation mode)")
     
     def _set_coin_acceptor_state(self, enable):
         """Enable or disable the coin acceptor."""
-        print(f"DEBUG: _set_coin_acceptor_state called with enable={enable}")
+        if _DEBUG:
+            print(f"DEBUG: _set_coin_acceptor_state called with enable={enable}")
         if self.gpio_available and self.pi and self.pi.connected:
             pin_value = 1 if enable else 0
-            print(f"DEBUG: Writing to COIN_INHIBIT_PIN {self.COIN_INHIBIT_PIN} with value {pin_value}")
-            self.pi.write(self.COIN_INHIBIT_PIN, pin_value)  # HIGH = enabled, LOW = disabled
+            if _DEBUG:
+                print(f"DEBUG: Writing to COIN_INHIBIT_PIN {self.COIN_INHIBIT_PIN} with value {pin_value}")
+            self._pi_write(self.COIN_INHIBIT_PIN, pin_value)  # HIGH = enabled, LOW = disabled
             print(f"Coin acceptor {'enabled' if enable else 'disabled'}")
         else:
             print(f"Coin acceptor {'enabled' if enable else 'disabled'} (simulation mode)")
@@ -152,6 +207,7 @@ class PersistentGPIO(QObject):
     def enable_payment(self):
         """Enable payment processing."""
         self.enabled = True
+        self._set_watchdogs(True)
         self._set_acceptor_state(True)  # Enable bill acceptor
         self._set_coin_acceptor_state(True)  # Enable coin acceptor
         self.payment_status.emit("Payment enabled - Insert coins or bills")
@@ -159,62 +215,57 @@ class PersistentGPIO(QObject):
     
     def disable_payment(self):
         """Disable payment processing."""
-        print("DEBUG: disable_payment() called")
+        if _DEBUG:
+            print("DEBUG: disable_payment() called")
         self.enabled = False
-        print("DEBUG: About to disable bill acceptor")
+        if _DEBUG:
+            print("DEBUG: About to disable bill acceptor")
         self._set_acceptor_state(False)  # Disable bill acceptor
-        print("DEBUG: About to disable coin acceptor")
+        if _DEBUG:
+            print("DEBUG: About to disable coin acceptor")
         self._set_coin_acceptor_state(False)  # Disable coin acceptor
+        self._set_watchdogs(False)
         self.payment_status.emit("Payment disabled")
         print("SUCCESS: Persistent GPIO payment disabled")
     
     def process_coin_timeout(self):
-        """Process coin timeout and emit coin value if applicable."""
-        if not self.enabled:
+        """
+        Process coin timeout and emit coin value if applicable. Pulse trains are
+        normally finalized by the pigpio watchdogs; this is a manual fallback.
+        """
+        if not self.enabled or not self.is_connected():
             return
             
+        now_tick = self.pi.get_current_tick()
+        coin_pulses = bill_pulses = 0
         with self._state_lock:
-            current_time = time.time()
-            
-            # Process coin timeout
-            if self.coin_pulse_count > 0 and (current_time - self.coin_last_pulse_time > self.COIN_TIMEOUT):
-                coin_value = self._get_coin_value(self.coin_pulse_count)
-                if coin_value > 0:
-                    self.coin_inserted.emit(coin_value)
-                    print(f"Coin processed: ₱{coin_value}")
-                self.coin_pulse_count = 0
-            
-            # Process bill timeout
-            if self.bill_pulse_count > 0 and (current_time - self.bill_last_pulse_time > self.BILL_TIMEOUT):
-                bill_value = self._get_bill_value(self.bill_pulse_count)
-                if bill_value > 0:
-                    self.bill_inserted.emit(bill_value)
-                    print(f"Bill processed: ₱{bill_value}")
-                self.bill_pulse_count = 0
+            # Snapshot and clear finished pulse trains; emit outside the lock
+            if self.coin_pulse_count > 0 and (pigpio.tickDiff(self.coin_last_pulse_time, now_tick) > self.COIN_TIMEOUT * 1e6):
+                coin_pulses, self.coin_pulse_count = self.coin_pulse_count, 0
+            if self.bill_pulse_count > 0 and (pigpio.tickDiff(self.bill_last_pulse_time, now_tick) > self.BILL_TIMEOUT * 1e6):
+                bill_pulses, self.bill_pulse_count = self.bill_pulse_count, 0
+        
+        # Process coin timeout
+        if coin_pulses:
+            coin_value = self._get_coin_value(coin_pulses)
+            if coin_value > 0:
+                self.coin_inserted.emit(coin_value)
+                print(f"Coin processed: ₱{coin_value}")
+        
+        # Process bill timeout
+        if bill_pulses:
+            bill_value = self._get_bill_value(bill_pulses)
+            if bill_value > 0:
+                self.bill_inserted.emit(bill_value)
+                print(f"Bill processed: ₱{bill_value}")
     
     def _get_coin_value(self, pulse_count):
         """Get coin value based on pulse count (matching original GPIOPaymentThread)."""
-        if pulse_count == 1:
-            return 1
-        elif 5 <= pulse_count <= 7:
-            return 5
-        elif 10 <= pulse_count <= 12:
-            return 10
-        elif 18 <= pulse_count <= 21:
-            return 20
-        return 0
+        return self.COIN_PULSE_VALUES.get(pulse_count, 0)
     
     def _get_bill_value(self, pulse_count):
         """Get bill value based on pulse count (matching original GPIOPaymentThread)."""
-        if pulse_count == 2:
-            return 20
-        elif pulse_count == 5:
-            return 50
-        elif pulse_count == 10:
-            return 100
-        elif pulse_count == 50:
-            return 500
-        return 0
+        return self.BILL_PULSE_VALUES.get(pulse_count, 0)
     
     def is_connected(self):
         """Check if GPIO is connected and running."""
@@ -237,6 +288,7 @@ class PersistentGPIO(QObject):
         
         if self.gpio_available and self.pi:
             try:
+                self._set_watchdogs(False)
                 # Cancel callbacks
                 if self.coin_callback:
                     self.coin_callback.cancel()
@@ -245,9 +297,8 @@ class PersistentGPIO(QObject):
                     self.bill_callback.cancel()
                     self.bill_callback = None
                 
-                # Disable acceptor
+                # Disable acceptor (pi.write returns once pigpiod has set the pin)
                 self._set_acceptor_state(False)
-                time.sleep(0.1)  # Small delay for state change
                 
                 # Stop pigpio
                 self.pi.stop()
@@ -71,14 +71,13 @@ class FileBrowserController(QWidget):
         """Handles continue to print options button click."""
         print(f"🔍 Continue button clicked")
         print(f"🔍 Selected PDF: {self.view.selected_pdf}")
-        print(f"🔍 Selected pages: {self.view.selected_pages}")
         
         if not self.view.selected_pdf:
             QMessageBox.warning(self, "No PDF Selected", "Please select a PDF file.")
             return
         
         # Get selected pages from the view
-        selected_pages_list = [page for page, selected in self.view.selected_pages.items() if selected]
+        selected_pages_list = self.view.selected_page_numbers()
         print(f"🔍 Selected pages list: {selected_pages_list}")
         
         if not selected_pages_list:
@@ -148,29 +147,25 @@ class FileBrowserController(QWidget):
         """Handles previous page button click."""
         if self.view.single_page_index > 1:
             self.view.single_page_index -= 1
-            self.view.show_single_page()
+            self.view.schedule_preview()
     
     def _next_page(self):
         """Handles next page button click."""
         if self.view.selected_pdf and self.view.single_page_index < self.view.selected_pdf['pages']:
             self.view.single_page_index += 1
-            self.view.show_single_page()
+            self.view.schedule_preview()
     
     def _prev_grid_page(self):
         """Handles previous grid page button click."""
         if self.view.current_grid_page > 1:
             self.view.current_grid_page -= 1
-            self.view.show_pdf_preview()
+            self.view.schedule_preview()
     
     def _next_grid_page(self):
         """Handles next grid page button click."""
-        if not self.view.selected_pdf:
-            return
-        total_doc_pages = self.view.selected_pdf['pages']
-        total_grid_pages = (total_doc_pages + self.view.ITEMS_PER_GRID_PAGE - 1) // self.view.ITEMS_PER_GRID_PAGE
-        if self.view.current_grid_page < total_grid_pages:
+        if self.view.current_grid_page < self.view.total_grid_pages:
             self.view.current_grid_page += 1
-            self.view.show_pdf_preview()
+            self.view.schedule_preview()
     
     def _page_widget_clicked(self, page_num):
         """Handles page widget click."""
@@ -179,9 +174,7 @@ class FileBrowserController(QWidget):
     
     def _page_checkbox_clicked(self, page_num, selected):
         """Handles page checkbox click."""
-        self.view.selected_pages[page_num] = selected
-        if self.view.selected_pdf:
-            self.view.pdf_page_selections[self.view.selected_pdf['path']] = self.view.selected_pages.copy()
+        self.view.set_page_selected(page_num, selected)
         self.view.update_selected_count()
         if self.view.view_mode == 'single' and page_num == self.view.single_page_index:
             self.view.single_page_checkbox.blockSignals(True)
@@ -191,8 +184,7 @@ class FileBrowserController(QWidget):
     def _single_page_checkbox_clicked(self, selected):
         """Handles single page checkbox click."""
         if self.view.selected_pdf:
-            self.view.selected_pages[self.view.single_page_index] = selected
-            self.view.pdf_page_selections[self.view.selected_pdf['path']] = self.view.selected_pages.copy()
+            self.view.set_page_selected(self.view.single_page_index, selected)
             self.view.update_selected_count()
     
     def load_pdf_files(self, pdf_files):
@@ -223,6 +215,4 @@ class FileBrowserController(QWidget):
     
     def _reset_timeout(self):
         """Reset the timeout timer (call on user activity)."""
-        self.timeout_timer.stop()
         self.timeout_timer.start(60000)
-        print("⏰ File browser screen timeout reset")
@@ -1,9 +1,12 @@
 import os
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QScrollArea,
     QFrame, QMessageBox, QGridLayout, QCheckBox, QSizePolicy, QStackedLayout, QSpacerItem
 )
-from PyQt5.QtCore import Qt, pyqtSignal, QThread, QPoint
+from PyQt5.QtCore import Qt, pyqtSignal, QThread, QPoint, QTimer, QObject, QRunnable, QThreadPool
 from PyQt5.QtGui import QPixmap, QImage, QWheelEvent, QMouseEvent, QTouchEvent
 from .pdf_preview_widget import PDFPreviewWidget
 
@@ -145,6 +148,8 @@ class PDFButton(QPushButton):
 class PDFPageWidget(QFrame):
     page_selected = pyqtSignal(int)
     page_checkbox_clicked = pyqtSignal(int, bool)
+    NORMAL_STYLE = "QFrame { background-color: white; border: 2px solid #ddd; border-radius: 8px; margin: 4px; }"
+    PREVIEW_LABEL_STYLE = "QLabel { background-color: #f9f9f9; border: 1px solid #ddd; border-radius: 4px; color: #36454F; font-size: 10px; }"
     def __init__(self, page_num=1, checked=True):
         super().__init__()
         self.page_num = page_num
@@ -154,7 +159,7 @@ class PDFPageWidget(QFrame):
         self.setup_ui(checked)
         
     def setup_ui(self, checked):
-        self.setStyleSheet("QFrame { background-color: white; border: 2px solid #ddd; border-radius: 8px; margin: 4px; }")
+        self.setStyleSheet(self.NORMAL_STYLE)
         layout = QVBoxLayout(self)
         layout.setContentsMargins(8, 8, 8, 8)
         layout.setSpacing(6)
@@ -187,12 +192,25 @@ class PDFPageWidget(QFrame):
         self.preview_label.setAlignment(Qt.AlignCenter)
         self.preview_label.setMinimumHeight(160)
         self.preview_label.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
-        self.preview_label.setStyleSheet("QLabel { background-color: #f9f9f9; border: 1px solid #ddd; border-radius: 4px; color: #36454F; font-size: 10px; }")
+        self.preview_label.setStyleSheet(self.PREVIEW_LABEL_STYLE)
         self.preview_label.setText(f"Loading\nPage {self.page_num}...")
         layout.addWidget(self.checkbox, 0)
         layout.addWidget(self.preview_label, 1)
         self.setMouseTracking(True)
         
+    def set_page(self, page_num, checked):
+        """Rebinds a pooled widget to another page, dropping the previous preview."""
+        self.page_num = page_num
+        self._original_pixmap = None
+        self.setStyleSheet(self.NORMAL_STYLE)
+        self.checkbox.blockSignals(True)
+        self.checkbox.setText(f"Page {page_num}")
+        self.checkbox.setChecked(checked)
+        self.checkbox.blockSignals(False)
+        self.preview_label.clear()
+        self.preview_label.setStyleSheet(self.PREVIEW_LABEL_STYLE)
+        self.preview_label.setText(f"Loading\nPage {page_num}...")
+
     def mousePressEvent(self, event):
         if not self.checkbox.geometry().contains(event.pos()): 
             self.page_selected.emit(self.page_num)
@@ -228,45 +246,158 @@ class PDFPageWidget(QFrame):
         self.preview_label.setText(f"Page {self.page_num}\n\nError:\n{error_msg}")
         self.preview_label.setStyleSheet("QLabel { background-color: #ffeeee; border: 1px solid #ffaaaa; border-radius: 4px; color: #cc0000; font-size: 9px; }")
 
-class PDFPreviewThread(QThread):
-    preview_ready = pyqtSignal(int, QPixmap)
+def render_rgb_samples(page, scale):
+    """Rasterises a page to packed 8-bit RGB and returns (samples, width, height, stride).
+
+    Rendering straight to csRGB lets MuPDF convert CMYK content once instead of
+    Qt doing it on every repaint, and the packed rows match QImage.Format_RGB888.
+    """
+    pix = page.get_pixmap(matrix=fitz.Matrix(scale, scale), colorspace=fitz.csRGB, alpha=False)
+    width, height = pix.width, pix.height
+    stride = width * 3
+    if pix.n != 3:
+        raise ValueError(f"Unexpected pixmap layout ({pix.n} components)")
+    samples = bytes(pix.samples)
+    if pix.stride != stride:
+        samples = b"".join(samples[row * pix.stride:row * pix.stride + stride] for row in range(height))
+    del pix
+    return samples, width, height, stride
+
+class DocumentCache:
+    """Keeps fitz documents open between preview renders.
+
+    A fitz.Document must not be used by two threads at once, so every borrower
+    gets a handle of its own; handles go back to the pool instead of being
+    closed, and only documents for the active PDF are kept.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._idle = {}  # pdf_path -> [fitz.Document]
+        self._active_path = None
+
+    @contextmanager
+    def borrow(self, pdf_path):
+        with self._lock:
+            handles = self._idle.get(pdf_path)
+            doc = handles.pop() if handles else None
+        if doc is None:
+            doc = fitz.open(pdf_path)
+        try:
+            yield doc
+        finally:
+            with self._lock:
+                keep = pdf_path == self._active_path
+                if keep:
+                    self._idle.setdefault(pdf_path, []).append(doc)
+            if not keep:
+                doc.close()
+
+    def retain_only(self, pdf_path):
+        """Closes idle documents for every PDF except pdf_path (None closes all)."""
+        with self._lock:
+            self._active_path = pdf_path
+            stale = [doc for path, docs in self._idle.items() if path != pdf_path for doc in docs]
+            self._idle = {path: docs for path, docs in self._idle.items() if path == pdf_path}
+        for doc in stale:
+            doc.close()
+
+class PageRenderSignals(QObject):
+    """Signals shared by PageRenderTask workers; QRunnable cannot emit on its own."""
+    preview_ready = pyqtSignal(str, int, object, bytes, int, int, int)  # pdf_path, page_num, render_key, samples, width, height, stride
+    error_occurred = pyqtSignal(int, str)
+
+class PageRenderTask(QRunnable):
+    """Renders one page preview on the global thread pool."""
+    # Previews are rendered close to their on-screen size, never below MIN_DPI
+    MIN_DPI = 96
+    MAX_DPI = 150  # cap for grid thumbnails
+
+    def __init__(self, pdf_path, page_num, render_key, fit_width, fit_height, max_dpi,
+                 signals, generation, current_generation, doc_cache):
+        super().__init__()
+        self.pdf_path = pdf_path
+        self.page_num = page_num
+        self.render_key = render_key
+        self.fit_width = fit_width
+        self.fit_height = fit_height
+        self.max_dpi = max_dpi
+        self.signals = signals
+        self.generation = generation
+        self.current_generation = current_generation
+        self.doc_cache = doc_cache
+
+    @staticmethod
+    def render_scale(page_rect, fit_width, fit_height=None, max_dpi=None):
+        """Returns the zoom that fits a page into fit_width (and fit_height, if given)."""
+        scale = fit_width / max(1.0, page_rect.width)
+        if fit_height:
+            scale = min(scale, fit_height / max(1.0, page_rect.height))
+        scale = max(PageRenderTask.MIN_DPI / 72, scale)
+        if max_dpi:
+            scale = min(max_dpi / 72, scale)
+        return scale
+
+    def is_cancelled(self):
+        return self.generation != self.current_generation()
+
+    def run(self):
+        # The view bumps its generation on every navigation; skip work nobody will see
+        if self.is_cancelled():
+            return
+        if not PYMUPDF_AVAILABLE:
+            self.signals.error_occurred.emit(self.page_num, "PyMuPDF not available")
+            return
+        try:
+            with self.doc_cache.borrow(self.pdf_path) as doc:
+                page = doc[self.page_num - 1]
+                # Render at the display size instead of a fixed high resolution
+                scale = self.render_scale(page.rect, self.fit_width, self.fit_height, self.max_dpi)
+                # Hand raw samples to the GUI thread, which owns all QImage/QPixmap work
+                samples, width, height, stride = render_rgb_samples(page, scale)
+                del page
+            if self.is_cancelled():
+                return
+            self.signals.preview_ready.emit(self.pdf_path, self.page_num, self.render_key,
+                                            samples, width, height, stride)
+        except Exception as e: 
+            if not self.is_cancelled():
+                self.signals.error_occurred.emit(self.page_num, str(e))
+
+class SinglePagePreviewThread(QThread):
+    """Renders one page for the single-page view; the QPixmap is built on the GUI thread."""
+    preview_ready = pyqtSignal(int, bytes, int, int, int)  # page_num, samples, width, height, stride
     error_occurred = pyqtSignal(int, str)
-    def __init__(self, pdf_path, pages_to_render: list):
+
+    def __init__(self, pdf_path, page_num, fit_width, fit_height, doc_cache):
         super().__init__()
         self.pdf_path = pdf_path
-        self.pages_to_render = pages_to_render
+        self.doc_cache = doc_cache
+        self.page_num = page_num
+        self.fit_width = fit_width
+        self.fit_height = fit_height
         self.running = True
-        
+
     def run(self):
         if not PYMUPDF_AVAILABLE:
-            for page_num in self.pages_to_render:
-                if not self.running: 
-                    break
-                self.error_occurred.emit(page_num, "PyMuPDF not available")
+            self.error_occurred.emit(self.page_num, "PyMuPDF not available")
             return
         try:
-            doc = fitz.open(self.pdf_path)
-            for page_num in self.pages_to_render:
-                if not self.running: 
-                    break
-                try:
-                    page = doc[page_num - 1]
-                    # Render at higher resolution to avoid pixelation in previews
-                    target_height_px = 1000  # target preview rendering height
-                    page_height_pts = max(1.0, page.rect.height)
-                    scale = min(5.0, max(1.5, target_height_px / page_height_pts))
-                    pix = page.get_pixmap(matrix=fitz.Matrix(scale, scale), alpha=False)
-                    qimg = QImage(pix.samples, pix.width, pix.height, pix.stride, QImage.Format_RGB888)
-                    pixmap = QPixmap.fromImage(qimg)
-                    self.preview_ready.emit(page_num, pixmap)
-                except Exception as e: 
-                    self.error_occurred.emit(page_num, str(e))
-            doc.close()
+            with self.doc_cache.borrow(self.pdf_path) as doc:
+                if self.page_num > len(doc) or not self.running:
+                    return
+                page = doc[self.page_num - 1]
+                scale = PageRenderTask.render_scale(page.rect, self.fit_width, self.fit_height)
+                # The MuPDF pixmap is released as soon as its samples are copied
+                samples, width, height, stride = render_rgb_samples(page, scale)
+                del page
+            if not self.running:
+                return
+            self.preview_ready.emit(self.page_num, samples, width, height, stride)
         except Exception as e:
-            err_page = self.pages_to_render[0] if self.pages_to_render else 1
-            self.error_occurred.emit(err_page, f"Failed to open PDF: {str(e)}")
-            
-    def stop(self): 
+            self.error_occurred.emit(self.page_num, str(e))
+
+    def stop(self):
         self.running = False
 
 class FileBrowserView(QWidget):
@@ -275,6 +406,11 @@ class FileBrowserView(QWidget):
     SINGLE_PAGE_PREVIEW_WIDTH = 280
     SINGLE_PAGE_PREVIEW_HEIGHT = 380
     ITEMS_PER_GRID_PAGE = 3
+    PIXMAP_CACHE_SIZE = 128  # rendered page previews kept in memory
+    SINGLE_PAGE_CACHE_SIZE = 4  # full-size renders: the current page plus prefetched neighbours
+    PREFETCH_DELAY_MS = 50
+    SINGLE_PAGE_OVERSAMPLE = 2.0  # headroom over fit-to-view size so zooming stays sharp
+    NAV_DEBOUNCE_MS = 75  # only the last of a burst of page flips starts a render
 
     # Signals for user interactions
     back_to_idle_clicked = pyqtSignal()
@@ -297,16 +433,46 @@ class FileBrowserView(QWidget):
         self.pdf_files_data = []
         self.selected_pdf = None
         self.pdf_buttons = []
+        self._buttons_by_path = {}
+        self._selected_button = None
         self.page_widgets = []
         self.page_widget_map = {}
         self.selected_pages = None
+        self._sel_path = None
+        self._sel_pages = 0
+        self._total_grid_pages = 0
         self.pdf_page_selections = {}
-        self.preview_thread = None
+        # Grid thumbnails render on the global QThreadPool; bumping the generation cancels them
+        self._render_signals = PageRenderSignals(self)
+        self._render_signals.preview_ready.connect(self.on_preview_ready)
+        self._render_signals.error_occurred.connect(self.on_preview_error)
+        self._render_generation = 0
+        # Open fitz documents reused by grid and single-page renders of the selected PDF
+        self._doc_cache = DocumentCache()
+        self.single_page_thread = None
+        self._pending_single_page = None
+        # Superseded render threads are kept alive until their render finishes
+        self._retired_threads = set()
+        # LRU caches of rendered previews keyed by (pdf_path, page_num, render_key); grid
+        # thumbnails use the tile width as render_key, single-page renders a (width, height) box
+        self._pixmap_cache = OrderedDict()
+        self._single_page_cache = OrderedDict()
+        self._grid_render_width = 0
+        self._single_render_key = None
         self.view_mode = 'all'
         self.single_page_index = 1
         self.current_grid_page = 1
+        self._nav_debounce = QTimer(self)
+        self._nav_debounce.setSingleShot(True)
+        self._nav_debounce.setInterval(self.NAV_DEBOUNCE_MS)
+        self._nav_debounce.timeout.connect(self._do_show_preview)
         self.setup_ui()
 
+    @property
+    def total_grid_pages(self):
+        """Number of grid pages for the selected PDF (0 when nothing is selected)."""
+        return self._total_grid_pages
+
     def setup_ui(self):
         """Sets up the user interface for the screen."""
         stacked_layout = QStackedLayout()
@@ -546,6 +712,16 @@ class FileBrowserView(QWidget):
         self.preview_layout.setColumnStretch(4, 0) # Right gutter
         # Use a single content row that takes all height
         self.preview_layout.setRowStretch(0, 1)
+        # Grid tiles are created once and rebound to new pages on every flip
+        self._widget_pool = []
+        for i in range(self.ITEMS_PER_GRID_PAGE):
+            page_widget = PDFPageWidget(0)
+            page_widget.page_selected.connect(self.page_widget_clicked.emit)
+            page_widget.page_checkbox_clicked.connect(self.page_checkbox_clicked.emit)
+            page_widget.hide()
+            # Arrange a single row at row 0 with 3 columns (1..3)
+            self.preview_layout.addWidget(page_widget, 0, (i % 3) + 1)
+            self._widget_pool.append(page_widget)
 
         # SINGLE PAGE VIEW CONTAINER (only the preview lives here to maximize height)
         self.single_page_widget = QWidget()
@@ -669,23 +845,30 @@ class FileBrowserView(QWidget):
     def load_pdf_files(self, pdf_files):
         """Loads PDF files into the list."""
         print(f"📁 Loading {len(pdf_files)} PDF files into view")
-        self.pdf_files_data = []
         self.pdf_page_selections = {}
-        for pdf_info in pdf_files: 
-            self.pdf_files_data.append({
+        self._pixmap_cache.clear()
+        self._single_page_cache.clear()
+        self._doc_cache.retain_only(None)
+        self.pdf_files_data = [
+            {
                 'filename': pdf_info['filename'], 
                 'type': 'pdf', 
                 'pages': pdf_info.get('pages', 1), 
                 'size': pdf_info['size'], 
                 'path': pdf_info['path']
-            })
+            }
+            for pdf_info in pdf_files
+        ]
         self.file_header.setText(f"PDF Files ({len(self.pdf_files_data)} files)")
         self.clear_file_list()
         self.pdf_buttons = []
+        self._buttons_by_path = {}
+        self._selected_button = None
         for pdf_data in self.pdf_files_data:
             pdf_btn = PDFButton(pdf_data)
             pdf_btn.pdf_selected.connect(self.pdf_button_clicked.emit)
             self.pdf_buttons.append(pdf_btn)
+            self._buttons_by_path[pdf_data['path']] = pdf_btn
             self.file_list_layout.insertWidget(self.file_list_layout.count() - 1, pdf_btn)
         
         # Automatically select the first file if available
@@ -698,6 +881,9 @@ class FileBrowserView(QWidget):
         else:
             self.selected_pdf = None
             self.selected_pages = None
+            self._sel_path = None
+            self._sel_pages = 0
+            self._total_grid_pages = 0
             self.clear_preview()
             self.page_info.setText("Select a PDF to preview pages")
             self.preview_header.setText("Select a PDF file to preview pages")
@@ -705,23 +891,45 @@ class FileBrowserView(QWidget):
 
     def clear_file_list(self):
         """Clears the file list."""
-        while self.file_list_layout.count() > 1:
-            child = self.file_list_layout.takeAt(0)
-            if child.widget(): 
-                child.widget().deleteLater()
+        container = self.file_list_layout.parentWidget()
+        if container is not None:
+            container.setUpdatesEnabled(False)
+        # Take items from the end (O(1) each) and keep the trailing stretch item
+        for index in range(self.file_list_layout.count() - 2, -1, -1):
+            child = self.file_list_layout.takeAt(index)
+            widget = child.widget() if child is not None else None
+            if widget: 
+                widget.hide()
+                widget.deleteLater()
+        if container is not None:
+            container.setUpdatesEnabled(True)
 
     def select_pdf(self, pdf_data):
         """Selects a PDF file and updates the UI."""
         print(f"📄 Selecting PDF: {pdf_data['filename']}")
-        if self.selected_pdf is not None and self.selected_pages is not None: 
-            self.pdf_page_selections[self.selected_pdf['path']] = self.selected_pages.copy()
+        if self._sel_path is not None and self.selected_pages is not None: 
+            self.pdf_page_selections[self._sel_path] = bytearray(self.selected_pages)
+        if self._sel_path != pdf_data['path']:
+            self._invalidate_pixmap_cache(keep_path=pdf_data['path'])
+        self._doc_cache.retain_only(pdf_data['path'])
         self.selected_pdf = pdf_data
-        if pdf_data['path'] in self.pdf_page_selections: 
-            self.selected_pages = self.pdf_page_selections[self.selected_pdf['path']].copy()
+        # Cached so preview and navigation code doesn't re-index pdf_data on every call
+        self._sel_path = pdf_data['path']
+        self._sel_pages = pdf_data['pages']
+        self._total_grid_pages = (self._sel_pages + self.ITEMS_PER_GRID_PAGE - 1) // self.ITEMS_PER_GRID_PAGE
+        if self._sel_path in self.pdf_page_selections: 
+            self.selected_pages = bytearray(self.pdf_page_selections[self._sel_path])
         else: 
-            self.selected_pages = {i: True for i in range(1, pdf_data['pages'] + 1)}
-        for btn in self.pdf_buttons: 
-            btn.set_selected(btn.pdf_data == pdf_data)
+            # One byte per page (index page_num - 1); every page starts selected
+            self.selected_pages = bytearray(b'\x01' * self._sel_pages)
+        # Only restyle the buttons whose state actually changes
+        new_button = self._buttons_by_path.get(self._sel_path)
+        if self._selected_button is not new_button:
+            if self._selected_button is not None:
+                self._selected_button.set_selected(False)
+            if new_button is not None:
+                new_button.set_selected(True)
+            self._selected_button = new_button
         self.preview_header.setText(f"{pdf_data['filename']}")
         self.view_mode = 'all'
         self.update_view_mode_buttons()
@@ -746,51 +954,66 @@ class FileBrowserView(QWidget):
             self.grid_page_label.hide()
             self.next_grid_page_btn.hide()
             return
+        # Suspend repaints so teardown and rebuild cost a single layout pass
+        self.preview_container.setUpdatesEnabled(False)
+        try:
+            self._build_grid_preview()
+        finally:
+            self.preview_container.setUpdatesEnabled(True)
+
+    def _build_grid_preview(self):
+        """Replaces the grid tiles with the pages of the current grid page."""
         self.clear_preview()
-        total_doc_pages = self.selected_pdf['pages']
+        total_doc_pages = self._sel_pages
         self.page_info.setText("")
         self.update_selected_count()
         self.select_all_btn.setVisible(True)
         self.deselect_all_btn.setVisible(True)
         self.continue_btn.setVisible(True)
-        total_grid_pages = (total_doc_pages + self.ITEMS_PER_GRID_PAGE - 1) // self.ITEMS_PER_GRID_PAGE
+        total_grid_pages = self.total_grid_pages
         self.grid_page_label.setText(f"{self.current_grid_page} / {total_grid_pages}")
         self.prev_grid_page_btn.setEnabled(self.current_grid_page > 1)
         self.next_grid_page_btn.setEnabled(self.current_grid_page < total_grid_pages)
         start_page = (self.current_grid_page - 1) * self.ITEMS_PER_GRID_PAGE + 1
         end_page = min(self.current_grid_page * self.ITEMS_PER_GRID_PAGE, total_doc_pages)
         pages_to_show = list(range(start_page, end_page + 1))
+        pdf_path = self._sel_path
+        self._grid_render_width = self._grid_tile_width()
+        # Resolve cached previews before touching the layout
+        cached_previews = {page_num: self._get_cached_pixmap(pdf_path, page_num, self._grid_render_width)
+                           for page_num in pages_to_show}
+        pages_to_render = [page_num for page_num in pages_to_show if cached_previews[page_num] is None]
         
         for i, page_num in enumerate(pages_to_show):
-            page_widget = PDFPageWidget(page_num, checked=self.selected_pages.get(page_num, True))
-            page_widget.page_selected.connect(self.page_widget_clicked.emit)
-            page_widget.page_checkbox_clicked.connect(self.page_checkbox_clicked.emit)
+            page_widget = self._widget_pool[i]
+            page_widget.set_page(page_num, checked=self.is_page_selected(page_num))
+            page_widget.show()
             self.page_widgets.append(page_widget)
             self.page_widget_map[page_num] = page_widget
-            # Arrange a single row at row 0 with 3 columns (1..3)
-            self.preview_layout.addWidget(page_widget, 0, (i % 3) + 1)
+            if cached_previews[page_num] is not None:
+                page_widget.set_preview_image(cached_previews[page_num])
             
         if PYMUPDF_AVAILABLE:
-            self.preview_thread = PDFPreviewThread(self.selected_pdf['path'], pages_to_show)
-            self.preview_thread.preview_ready.connect(self.on_preview_ready)
-            self.preview_thread.error_occurred.connect(self.on_preview_error)
-            self.preview_thread.start()
+            self._submit_render_tasks(pages_to_render, self._grid_render_width)
+            # Warm the next grid page at low priority so paging forward is instant
+            next_pages = range(end_page + 1, min(end_page + self.ITEMS_PER_GRID_PAGE, total_doc_pages) + 1)
+            self._prefetch(next_pages, self._grid_render_width)
         else:
             for widget in self.page_widgets: 
                 widget.preview_label.setText(f"Page {widget.page_num}\n\nPDF Preview\nRequires PyMuPDF")
 
     def clear_preview(self):
         """Clears the preview area."""
-        if self.preview_thread and self.preview_thread.isRunning(): 
-            self.preview_thread.stop()
-            self.preview_thread.wait()
+        self._nav_debounce.stop()
+        # Queued and in-flight thumbnail tasks drop their results once the generation moves on
+        self._render_generation += 1
+        self._stop_single_page_thread()
         
-        while self.preview_layout.count():
-            item = self.preview_layout.takeAt(0)
-            if item is not None:
-                widget = item.widget()
-                if widget is not None:
-                    widget.deleteLater()
+        updates_were_enabled = self.preview_container.updatesEnabled()
+        self.preview_container.setUpdatesEnabled(False)
+        for page_widget in self._widget_pool:
+            page_widget.hide()
+        self.preview_container.setUpdatesEnabled(updates_were_enabled)
             
         self.page_widgets.clear()
         self.page_widget_map.clear()
@@ -814,31 +1037,48 @@ class FileBrowserView(QWidget):
         if not self.selected_pdf: 
             return
         self.single_page_preview.setBorderless(True)
-        total_pages = self.selected_pdf['pages']
+        total_pages = self._sel_pages
         if not (1 <= self.single_page_index <= total_pages): 
             self.single_page_index = 1
         page_num = self.single_page_index
         self.page_info.setText(f"Page {page_num} of {total_pages}")
         self.page_input.setText(f"{page_num}")
         self.single_page_checkbox.blockSignals(True)
-        self.single_page_checkbox.setChecked(self.selected_pages.get(page_num, False))
+        self.single_page_checkbox.setChecked(self.is_page_selected(page_num))
         self.single_page_checkbox.blockSignals(False)
-        self.single_page_preview.clear()
-        if PYMUPDF_AVAILABLE:
-            try:
-                doc = fitz.open(self.selected_pdf['path'])
-                if page_num <= len(doc):
-                    page = doc[page_num-1]
-                    # Increase DPI for sharper single-page preview (from 300 to 450 DPI)
-                    pix = page.get_pixmap(matrix=fitz.Matrix(450/72, 450/72), alpha=False)
-                    qimg = QImage(pix.samples, pix.width, pix.height, pix.stride, QImage.Format_RGB888)
-                    self.single_page_preview.setPixmap(QPixmap.fromImage(qimg))
-                doc.close()
-            except Exception as e: 
-                print(f"Error rendering page {page_num}: {e}")
-                self.single_page_preview.clear()
-        else: 
+        # A new page supersedes queued prefetches and grid thumbnails
+        self._render_generation += 1
+        self._single_render_key = self._single_page_render_key()
+        cached = self._get_cached_pixmap(self._sel_path, page_num, self._single_render_key)
+        if cached is not None:
+            self._stop_single_page_thread()
+            self._pending_single_page = page_num
+            self.single_page_preview.setPixmap(cached)
+            self._schedule_single_page_prefetch(page_num)
+        else:
             self.single_page_preview.clear()
+            self._start_single_page_render(page_num)
+
+    def schedule_preview(self):
+        """Updates the page indicators now and renders once navigation settles."""
+        if not self.selected_pdf:
+            return
+        total_doc_pages = self._sel_pages
+        if self.view_mode == 'single':
+            self.page_info.setText(f"Page {self.single_page_index} of {total_doc_pages}")
+            self.page_input.setText(f"{self.single_page_index}")
+        else:
+            self.grid_page_label.setText(f"{self.current_grid_page} / {self.total_grid_pages}")
+            self.prev_grid_page_btn.setEnabled(self.current_grid_page > 1)
+            self.next_grid_page_btn.setEnabled(self.current_grid_page < self.total_grid_pages)
+        self._nav_debounce.start()
+
+    def _do_show_preview(self):
+        """Renders the page(s) for the current navigation position."""
+        if self.view_mode == 'single':
+            self.show_single_page()
+        else:
+            self.show_pdf_preview()
 
     def update_view_mode_buttons(self):
         """Updates the view mode buttons."""
@@ -855,58 +1095,212 @@ class FileBrowserView(QWidget):
         """Sets the view to single page mode."""
         self.view_mode = 'single'
         self.update_view_mode_buttons()
-        if self.selected_pdf and not (1 <= self.single_page_index <= self.selected_pdf['pages']): 
+        if self.selected_pdf and not (1 <= self.single_page_index <= self._sel_pages): 
             self.single_page_index = 1
         self.show_single_page()
 
+    def is_page_selected(self, page_num):
+        """Returns whether a 1-based page is marked for printing."""
+        return bool(self.selected_pages) and self.selected_pages[page_num - 1] == 1
+
+    def set_page_selected(self, page_num, selected):
+        """Marks a 1-based page for printing and remembers the selection for this PDF."""
+        self.selected_pages[page_num - 1] = 1 if selected else 0
+        if self.selected_pdf:
+            self.pdf_page_selections[self._sel_path] = bytearray(self.selected_pages)
+
+    def selected_page_numbers(self):
+        """Returns the selected pages as a sorted list of 1-based page numbers."""
+        if not self.selected_pages:
+            return []
+        return [index + 1 for index, selected in enumerate(self.selected_pages) if selected]
+
     def update_selected_count(self):
         """Updates the selected count display."""
         if not self.selected_pages: 
             return
-        selected_count = sum(1 for selected in self.selected_pages.values() if selected)
+        selected_count = self.selected_pages.count(1)
         self.selected_count_label.setText(f"Selected: {selected_count}/{len(self.selected_pages)} pages")
         self.continue_btn.setEnabled(selected_count > 0)
 
     def select_all_pages(self):
         """Selects all pages."""
-        if not self.selected_pages: 
-            return
-        for page_num in self.selected_pages: 
-            self.selected_pages[page_num] = True
-        if self.selected_pdf: 
-            self.pdf_page_selections[self.selected_pdf['path']] = self.selected_pages.copy()
-        for widget in self.page_widgets: 
-            widget.checkbox.setChecked(True)
-        self.update_selected_count()
-        if self.view_mode == 'single': 
-            self.single_page_checkbox.blockSignals(True)
-            self.single_page_checkbox.setChecked(True)
-            self.single_page_checkbox.blockSignals(False)
+        self._set_all_pages_selected(True)
 
     def deselect_all_pages(self):
         """Deselects all pages."""
+        self._set_all_pages_selected(False)
+
+    def _set_all_pages_selected(self, selected):
+        """Applies one selection state to every page and refreshes the UI in a single pass."""
         if not self.selected_pages: 
             return
-        for page_num in self.selected_pages: 
-            self.selected_pages[page_num] = False
+        value = b'\x01' if selected else b'\x00'
+        if self.selected_pages.count(value) == len(self.selected_pages):
+            return
+        self.selected_pages[:] = value * len(self.selected_pages)
         if self.selected_pdf: 
-            self.pdf_page_selections[self.selected_pdf['path']] = self.selected_pages.copy()
+            self.pdf_page_selections[self._sel_path] = bytearray(self.selected_pages)
+        self.preview_container.setUpdatesEnabled(False)
         for widget in self.page_widgets: 
-            widget.checkbox.setChecked(False)
+            if widget.checkbox.isChecked() != selected:
+                widget.checkbox.blockSignals(True)
+                widget.checkbox.setChecked(selected)
+                widget.checkbox.blockSignals(False)
+        self.preview_container.setUpdatesEnabled(True)
         self.update_selected_count()
         if self.view_mode == 'single': 
             self.single_page_checkbox.blockSignals(True)
-            self.single_page_checkbox.setChecked(False)
+            self.single_page_checkbox.setChecked(selected)
             self.single_page_checkbox.blockSignals(False)
 
-    def on_preview_ready(self, page_num, pixmap):
-        """Handles when a preview is ready."""
-        if self.view_mode == 'all':
+    def _grid_tile_width(self):
+        """Estimates the pixel width of one grid tile, rounded up so cache keys stay stable."""
+        margins = self.preview_layout.contentsMargins()
+        spacing = self.preview_layout.spacing() * (self.ITEMS_PER_GRID_PAGE - 1)
+        usable = self.preview_container.width() - margins.left() - margins.right() - spacing
+        tile_width = max(1, usable // self.ITEMS_PER_GRID_PAGE)
+        return -(-tile_width // 100) * 100
+
+    def _start_single_page_render(self, page_num):
+        """Renders page_num for the single-page view on a worker thread."""
+        self._stop_single_page_thread()
+        self._pending_single_page = page_num
+        if not PYMUPDF_AVAILABLE:
+            return
+        fit_width, fit_height = self._single_render_key
+        self.single_page_thread = SinglePagePreviewThread(
+            self._sel_path, page_num, fit_width, fit_height, self._doc_cache,
+        )
+        self.single_page_thread.preview_ready.connect(self.on_single_page_ready)
+        self.single_page_thread.error_occurred.connect(self.on_single_page_error)
+        self.single_page_thread.finished.connect(self._release_retired_thread)
+        self.single_page_thread.start()
+
+    def _single_page_render_key(self):
+        """Returns the (width, height) box single-page renders fit into.
+
+        Renders match the preview area's size (with zoom headroom) rather than a fixed 450 DPI.
+        """
+        size = self.single_page_preview.size()
+        return (int(size.width() * self.SINGLE_PAGE_OVERSAMPLE),
+                int(size.height() * self.SINGLE_PAGE_OVERSAMPLE))
+
+    def _submit_render_tasks(self, page_nums, render_key, priority=0):
+        """Queues PageRenderTasks for the selected PDF on the global thread pool."""
+        if isinstance(render_key, tuple):
+            fit_width, fit_height = render_key
+            max_dpi = None
+        else:
+            fit_width, fit_height, max_dpi = render_key, None, PageRenderTask.MAX_DPI
+        pool = QThreadPool.globalInstance()
+        generation = self._render_generation
+        for page_num in page_nums:
+            pool.start(PageRenderTask(self._sel_path, page_num, render_key, fit_width, fit_height, max_dpi,
+                                      self._render_signals, generation, self._current_render_generation,
+                                      self._doc_cache), priority)
+
+    def _prefetch(self, page_nums, render_key):
+        """Renders pages that are likely to be shown next into the cache, behind visible work."""
+        if not self.selected_pdf or not PYMUPDF_AVAILABLE:
+            return
+        pages = [page_num for page_num in page_nums
+                 if 1 <= page_num <= self._sel_pages
+                 and self._get_cached_pixmap(self._sel_path, page_num, render_key) is None]
+        self._submit_render_tasks(pages, render_key, priority=-1)
+
+    def _schedule_single_page_prefetch(self, page_num):
+        """Prefetches the neighbours of page_num once the single-page view has settled."""
+        generation = self._render_generation
+
+        def prefetch():
+            # Skip if the user has moved on since this page was shown
+            if generation == self._render_generation and self.view_mode == 'single':
+                self._prefetch((page_num - 1, page_num + 1, page_num + 2), self._single_render_key)
+
+        QTimer.singleShot(self.PREFETCH_DELAY_MS, prefetch)
+
+    def _current_render_generation(self):
+        """Returns the generation grid render tasks must match to publish results."""
+        return self._render_generation
+
+    def _stop_single_page_thread(self):
+        """Cancels the current single-page render without blocking the GUI thread."""
+        self._retire_thread(self.single_page_thread)
+        self.single_page_thread = None
+        self._pending_single_page = None
+
+    def _retire_thread(self, thread):
+        """Stops a single-page thread and keeps it referenced until its render finishes."""
+        if thread is not None and thread.isRunning():
+            thread.stop()
+            self._retired_threads.add(thread)
+
+    def _release_retired_thread(self):
+        """Drops the last reference to a stopped single-page thread once it has finished."""
+        self._retired_threads.discard(self.sender())
+
+    def on_single_page_ready(self, page_num, samples, width, height, stride):
+        """Builds the single-page pixmap from bytes rendered by the worker thread."""
+        # Drop results for a page the user has already navigated away from
+        if page_num != self._pending_single_page or self.view_mode != 'single':
+            return
+        qimg = QImage(samples, width, height, stride, QImage.Format_RGB888)
+        pixmap = QPixmap.fromImage(qimg)
+        self._cache_pixmap(self._sel_path, page_num, self._single_render_key, pixmap)
+        self.single_page_preview.setPixmap(pixmap)
+        self._schedule_single_page_prefetch(page_num)
+
+    def on_single_page_error(self, page_num, error_msg):
+        """Handles a failed single-page render."""
+        print(f"Error rendering page {page_num}: {error_msg}")
+        if page_num == self._pending_single_page:
+            self.single_page_preview.clear()
+
+    def _cache_for(self, render_key):
+        """Returns the LRU cache and its size limit for a render key."""
+        if isinstance(render_key, tuple):
+            return self._single_page_cache, self.SINGLE_PAGE_CACHE_SIZE
+        return self._pixmap_cache, self.PIXMAP_CACHE_SIZE
+
+    def _get_cached_pixmap(self, pdf_path, page_num, render_key):
+        """Returns a cached preview pixmap, or None if the page was not rendered yet."""
+        cache, _ = self._cache_for(render_key)
+        key = (pdf_path, page_num, render_key)
+        pixmap = cache.get(key)
+        if pixmap is not None:
+            cache.move_to_end(key)
+        return pixmap
+
+    def _cache_pixmap(self, pdf_path, page_num, render_key, pixmap):
+        """Stores a rendered preview, evicting the least recently used entries."""
+        cache, limit = self._cache_for(render_key)
+        key = (pdf_path, page_num, render_key)
+        cache[key] = pixmap
+        cache.move_to_end(key)
+        while len(cache) > limit:
+            cache.popitem(last=False)
+
+    def _invalidate_pixmap_cache(self, keep_path=None):
+        """Drops cached previews for every PDF except keep_path."""
+        for cache in (self._pixmap_cache, self._single_page_cache):
+            for key in [k for k in cache if k[0] != keep_path]:
+                del cache[key]
+
+    def on_preview_ready(self, pdf_path, page_num, render_key, samples, width, height, stride):
+        """Builds a preview pixmap on the GUI thread from samples rendered by a worker."""
+        # Ignore late results from a task started for a previously selected PDF
+        if not self.selected_pdf or self._sel_path != pdf_path:
+            return
+        # fromImage copies the pixels, so samples only has to outlive this call
+        qimg = QImage(samples, width, height, stride, QImage.Format_RGB888)
+        pixmap = QPixmap.fromImage(qimg)
+        self._cache_pixmap(pdf_path, page_num, render_key, pixmap)
+        # Prefetched pages are only cached; the visible single page comes from its own thread
+        if self.view_mode == 'all' and render_key == self._grid_render_width:
             widget = self.page_widget_map.get(page_num)
             if widget: 
                 widget.set_preview_image(pixmap)
-        elif self.view_mode == 'single' and page_num == self.single_page_index: 
-            self.single_page_preview.setPixmap(pixmap)
 
     def on_preview_error(self, page_num, error_msg):
         """Handles when a preview error occurs."""
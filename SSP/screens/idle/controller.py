@@ -1,5 +1,8 @@
 # screens/idle/controller.py
 
+import atexit
+import threading
+
 from PyQt5.QtWidgets import QWidget, QGridLayout, QDialog
 from PyQt5.QtCore import Qt
 
@@ -14,6 +17,30 @@ try:
 except ImportError:
     GPIO_AVAILABLE = False
 
+# GPIO pin definitions (matching persistent GPIO)
+COIN_INHIBIT_PIN = 22  # Coin acceptor inhibit pin
+BILL_INHIBIT_PIN = 23  # Bill acceptor inhibit pin
+
+# One pigpio connection shared by every idle enter/leave instead of connecting each time
+_pi = None
+_pi_lock = threading.Lock()
+
+def _get_pi():
+    """Returns the shared pigpio connection with the inhibit pins configured, or None."""
+    global _pi
+    with _pi_lock:
+        if _pi is not None and _pi.connected:
+            return _pi
+        pi = pigpio.pi()
+        if not pi.connected:
+            print("IDLE: Could not connect to pigpio daemon")
+            return None
+        pi.set_mode(COIN_INHIBIT_PIN, pigpio.OUTPUT)
+        pi.set_mode(BILL_INHIBIT_PIN, pigpio.OUTPUT)
+        atexit.register(pi.stop)
+        _pi = pi
+        return _pi
+
 class IdleController(QWidget):
     """Manages the Idle screen's logic and UI."""
     
@@ -73,42 +100,18 @@ class IdleController(QWidget):
             return
         
         try:
-            # Create a temporary GPIO connection for manual control
-            pi = pigpio.pi()
-            if not pi.connected:
-                print("IDLE: Could not connect to pigpio daemon")
+            pi = _get_pi()
+            if pi is None:
                 return
             
-            # GPIO pin definitions (matching persistent GPIO)
-            COIN_INHIBIT_PIN = 22  # Coin acceptor inhibit pin
-            BILL_INHIBIT_PIN = 23   # Bill acceptor inhibit pin
-            
             # Disable coin acceptor (HIGH = enabled, LOW = disabled)
-            pi.set_mode(COIN_INHIBIT_PIN, pigpio.OUTPUT)
             pi.write(COIN_INHIBIT_PIN, 0)  # LOW = disabled
-            print("IDLE: Coin acceptor disabled")
-            
             # Disable bill acceptor (LOW = enabled, HIGH = disabled)  
-            pi.set_mode(BILL_INHIBIT_PIN, pigpio.OUTPUT)
             pi.write(BILL_INHIBIT_PIN, 1)  # HIGH = disabled
-            print("IDLE: Bill acceptor disabled")
-            
-            # Small delay to ensure state change
-            import time
-            time.sleep(0.1)
-            
-            # Clean up the temporary connection
-            pi.stop()
             print("IDLE: Acceptors manually disabled successfully")
             
         except Exception as e:
             print(f"IDLE: Error manually disabling acceptors: {e}")
-            # Try to clean up even if there was an error
-            try:
-                if 'pi' in locals():
-                    pi.stop()
-            except:
-                pass
     
     # --- Public API for main_app ---
     
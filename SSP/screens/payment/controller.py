@@ -2,6 +2,7 @@ from PyQt5.QtWidgets import QWidget, QMessageBox
 from PyQt5.QtCore import Qt, pyqtSignal, QTimer
 from .model import PaymentModel
 from .view import PaymentScreenView
+from utils.debug import DEBUG as _DEBUG
 
 class PaymentController(QWidget):
     """Controller for the Payment screen - coordinates between model and view."""
@@ -74,36 +75,47 @@ class PaymentController(QWidget):
     
     def on_enter(self):
         """Called when the payment screen is shown."""
-        print("*** PAYMENT CONTROLLER ON_ENTER METHOD CALLED ***")
-        print("=== PAYMENT CONTROLLER ON_ENTER START ===")
-        print("DEBUG: Payment controller on_enter() called")
-        print(f"DEBUG: Controller type: {type(self)}")
-        print(f"DEBUG: Model type: {type(self.model)}")
-        print(f"DEBUG: View type: {type(self.view)}")
+        if _DEBUG:
+            print("*** PAYMENT CONTROLLER ON_ENTER METHOD CALLED ***")
+            print("=== PAYMENT CONTROLLER ON_ENTER START ===")
+            print("DEBUG: Payment controller on_enter() called")
+            print(f"DEBUG: Controller type: {type(self)}")
+            print(f"DEBUG: Model type: {type(self.model)}")
+            print(f"DEBUG: View type: {type(self.view)}")
         
         # Start timeout timer (1 minute)
         self.timeout_timer.start(60000)
-        print("TIMEOUT: Payment screen timeout started (1 minute)")
-        
-        print("DEBUG: About to call model.on_enter()")
+        if _DEBUG:
+            print("TIMEOUT: Payment screen timeout started (1 minute)")
+            print("DEBUG: About to call model.on_enter()")
+        # The view's labels live in this widget; hold its repaints while the model
+        # resets amount, change, suggestion and status so they land as one update
+        self.setUpdatesEnabled(False)
         try:
             self.model.on_enter()
-            print("DEBUG: model.on_enter() completed")
+            if _DEBUG:
+                print("DEBUG: model.on_enter() completed")
         except Exception as e:
             print(f"DEBUG: model.on_enter() failed with error: {e}")
-        self.view.set_buttons_enabled(True)
-        print("DEBUG: Payment controller on_enter() completed")
-        print("=== PAYMENT CONTROLLER ON_ENTER END ===")
+        finally:
+            self.view.set_buttons_enabled(True)
+            self.setUpdatesEnabled(True)
+        if _DEBUG:
+            print("DEBUG: Payment controller on_enter() completed")
+            print("=== PAYMENT CONTROLLER ON_ENTER END ===")
     
     def on_leave(self):
         """Called when leaving the payment screen."""
-        print("*** PAYMENT CONTROLLER ON_LEAVE METHOD CALLED ***")
+        if _DEBUG:
+            print("*** PAYMENT CONTROLLER ON_LEAVE METHOD CALLED ***")
         # Stop timeout timer
         self.timeout_timer.stop()
-        print("TIMEOUT: Payment screen timeout stopped")
+        if _DEBUG:
+            print("TIMEOUT: Payment screen timeout stopped")
         # Disable payment pins
         self.model.on_leave()
-        print("*** PAYMENT CONTROLLER ON_LEAVE COMPLETED ***")
+        if _DEBUG:
+            print("*** PAYMENT CONTROLLER ON_LEAVE COMPLETED ***")
     
     def go_back(self):
         """Public method to go back to print options screen."""
@@ -140,11 +152,6 @@ class PaymentController(QWidget):
     # When model recomputes the best suggestion, reflect it in the view via existing status signal
     # PaymentModel already emits payment_status_updated; hook that to update label too
     
-    def on_leave(self):
-        """Called by main_app when leaving this screen."""
-        # Stop timeout timer
-        self.timeout_timer.stop()
-    
     def _on_timeout(self):
         """Handle timeout - return to idle screen."""
         print("TIMEOUT: Payment screen timeout - returning to idle screen")
@@ -156,9 +163,7 @@ class PaymentController(QWidget):
     
     def _reset_timeout(self):
         """Reset the timeout timer (call on user activity)."""
-        self.timeout_timer.stop()
         self.timeout_timer.start(60000)
-        print("TIMEOUT: Payment screen timeout reset")
     
     def _manual_disable_acceptors(self):
         """Manually disable acceptors as a safety backup."""
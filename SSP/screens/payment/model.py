@@ -1,13 +1,53 @@
 import os
-import time
+import array
 import threading
+from collections import OrderedDict
+from dataclasses import dataclass
 from typing import Tuple, List, Dict
-from PyQt5.QtCore import QObject, QThread, pyqtSignal
-from managers.hopper_manager import ChangeDispenser, DispenseThread, PIGPIO_AVAILABLE as HOPPER_GPIO_AVAILABLE
+from PyQt5.QtCore import QObject, QThread, QThreadPool, QTimer, pyqtSignal
+from managers.hopper_manager import ChangeDispenser, DispenseSignals, DispenseTask, PIGPIO_AVAILABLE as HOPPER_GPIO_AVAILABLE
 from managers.payment_algorithm_manager import PaymentAlgorithmManager
-from database.db_manager import DatabaseManager
+from database.db_manager import DatabaseManager, CASH_TYPES
 
-from managers.persistent_gpio import get_persistent_gpio, PIGPIO_AVAILABLE as PAYMENT_GPIO_AVAILABLE
+from managers.persistent_gpio import PersistentGPIO, get_persistent_gpio, PIGPIO_AVAILABLE as PAYMENT_GPIO_AVAILABLE
+
+try:
+    import pigpio
+except ImportError:
+    pigpio = None
+
+# Payment-mode status lines; PAYMENT_GPIO_AVAILABLE is fixed at import
+if PAYMENT_GPIO_AVAILABLE:
+    _MODE_ENABLED_MSG = "Payment mode enabled - Insert coins or bills"
+    _MODE_DISABLED_MSG = "Payment mode disabled"
+else:
+    _MODE_ENABLED_MSG = "Payment mode enabled - Use simulation buttons"
+    _MODE_DISABLED_MSG = "Payment mode disabled (Simulation)"
+
+from utils.debug import DEBUG as _DEBUG
+
+# Legal cash denominations; cash_received keeps one counter per entry
+_DENOMS = (1, 5, 10, 20, 50, 100, 500)
+_DENOM_IDX = {d: i for i, d in enumerate(_DENOMS)}
+# Inventory type for each entry of _DENOMS
+_DENOM_KIND = tuple(CASH_TYPES[d] for d in _DENOMS)
+
+
+@dataclass(frozen=True)
+class PaymentSummary:
+    """Job summary shown at the top of the payment screen."""
+    __slots__ = ('total_cost', 'document_name', 'copies', 'color_mode', 'black_pages', 'color_pages')
+    total_cost: float
+    document_name: str
+    copies: int
+    color_mode: str
+    black_pages: int
+    color_pages: int
+
+
+def _new_cash_counts():
+    """Returns a zeroed counter array indexed by _DENOM_IDX."""
+    return array.array('I', [0] * len(_DENOMS))
 
 
 class GPIOPaymentThread(QThread):
@@ -17,23 +57,25 @@ class GPIOPaymentThread(QThread):
     payment_status = pyqtSignal(str)
     enable_acceptor = pyqtSignal(bool)
 
+    COIN_TIMEOUT = 0.5    # seconds without pulses = end of coin
+    PULSE_TIMEOUT = 0.5   # Time to wait for additional bill pulses
+    GLITCH_FILTER_US = PersistentGPIO.GLITCH_FILTER_US
+    COIN_PIN, BILL_PIN, INHIBIT_PIN, COIN_INHIBIT_PIN = 17, 18, 23, 22
+
     def __init__(self):
         super().__init__()
         self.running = True
         self.pi = None
+        self._pi_write = None
+        # Pulse state is shared with pigpio's callback thread
+        self._pulse_lock = threading.Lock()
+        self.coin_pulse_count = 0
+        self.bill_pulse_count = 0
         self.gpio_available = PAYMENT_GPIO_AVAILABLE
         if self.gpio_available:
             self.setup_gpio()
         else:
             self.setup_mock_gpio()
-
-        self.coin_pulse_count = 0
-        self.coin_last_pulse_time = time.time()
-        self.bill_pulse_count = 0
-        self.bill_last_pulse_time = time.time()
-        self.COIN_TIMEOUT = 0.5    # seconds without pulses = end of coin
-        self.PULSE_TIMEOUT = 0.5   # Time to wait for additional bill pulses
-        self.DEBOUNCE_TIME = 0.1   # Minimum time between pulses
         
         # Print-related attributes
         self.print_file_path = None
@@ -50,7 +92,7 @@ class GPIOPaymentThread(QThread):
             self.pi = pigpio.pi()
             if not self.pi.connected:
                 raise Exception("Could not connect to pigpio daemon")
-            self.COIN_PIN, self.BILL_PIN, self.INHIBIT_PIN, self.COIN_INHIBIT_PIN = 17, 18, 23, 22
+            self._pi_write = self.pi.write
             
             # Setup coin acceptor GPIO
             self.pi.set_mode(self.COIN_PIN, pigpio.INPUT)
@@ -68,6 +110,15 @@ class GPIOPaymentThread(QThread):
             self.set_acceptor_state(False)  # Start disabled
             self.pi.callback(self.BILL_PIN, pigpio.FALLING_EDGE, self.bill_pulse_detected)
             
+            # Debounce in the pigpio daemon so bounces never reach the Python callbacks
+            self.pi.set_glitch_filter(self.COIN_PIN, self.GLITCH_FILTER_US)
+            self.pi.set_glitch_filter(self.BILL_PIN, self.GLITCH_FILTER_US)
+            
+            # pigpio reports pigpio.TIMEOUT to the callbacks after this much silence,
+            # which marks the end of a coin/bill pulse train without polling
+            self.pi.set_watchdog(self.COIN_PIN, int(self.COIN_TIMEOUT * 1000))
+            self.pi.set_watchdog(self.BILL_PIN, int(self.PULSE_TIMEOUT * 1000))
+            
             self.payment_status.emit("Payment system ready - Coin and bill acceptors disabled")
         except Exception as e:
             self.payment_status.emit(f"GPIO Error: {str(e)}")
@@ -78,83 +129,70 @@ class GPIOPaymentThread(QThread):
 
     def set_acceptor_state(self, enable):
         if self.gpio_available and self.pi:
-            self.pi.write(self.INHIBIT_PIN, 0 if enable else 1)  # LOW = enabled, HIGH = disabled
+            self._pi_write(self.INHIBIT_PIN, 0 if enable else 1)  # LOW = enabled, HIGH = disabled
             print(f"Bill acceptor {'enabled' if enable else 'disabled'}")
         else:
             self.payment_status.emit(f"Bill acceptor {'enabled' if enable else 'disabled'} (simulation mode)")
 
     def set_coin_acceptor_state(self, enable):
         if self.gpio_available and self.pi:
-            self.pi.write(self.COIN_INHIBIT_PIN, 1 if enable else 0)  # HIGH = enabled, LOW = disabled
+            self._pi_write(self.COIN_INHIBIT_PIN, 1 if enable else 0)  # HIGH = enabled, LOW = disabled
             print(f"Coin acceptor {'enabled' if enable else 'disabled'}")
         else:
             self.payment_status.emit(f"Coin acceptor {'enabled' if enable else 'disabled'} (simulation mode)")
 
     def coin_pulse_detected(self, gpio, level, tick):
-        current_time = time.time()
-        if current_time - self.coin_last_pulse_time > self.DEBOUNCE_TIME:
+        if level == pigpio.TIMEOUT:
+            with self._pulse_lock:
+                pulses, self.coin_pulse_count = self.coin_pulse_count, 0
+            if pulses:
+                coin_value = self.get_coin_value(pulses)
+                if coin_value > 0:
+                    self.coin_inserted.emit(coin_value)
+            return
+        with self._pulse_lock:
             self.coin_pulse_count += 1
-            self.coin_last_pulse_time = current_time
 
     def bill_pulse_detected(self, gpio, level, tick):
-        current_time = time.time()
-        if current_time - self.bill_last_pulse_time > self.DEBOUNCE_TIME:
+        if level == pigpio.TIMEOUT:
+            with self._pulse_lock:
+                pulses, self.bill_pulse_count = self.bill_pulse_count, 0
+            if pulses:
+                bill_value = self.get_bill_value(pulses)
+                if bill_value > 0:
+                    self.bill_inserted.emit(bill_value)
+            return
+        with self._pulse_lock:
             self.bill_pulse_count += 1
-            self.bill_last_pulse_time = current_time
 
     def get_coin_value(self, pulses):
-        if pulses == 1:
-            return 1
-        elif 5 <= pulses <= 7:
-            return 5
-        elif 10 <= pulses <= 12:
-            return 10
-        elif 18 <= pulses <= 21:
-            return 20
-        return 0
+        return PersistentGPIO.COIN_PULSE_VALUES.get(pulses, 0)
 
     def get_bill_value(self, pulses):
-        if pulses == 2:
-            return 20
-        elif pulses == 5:
-            return 50
-        elif pulses == 10:
-            return 100
-        elif pulses == 50:
-            return 500
-        return 0
+        return PersistentGPIO.BILL_PULSE_VALUES.get(pulses, 0)
 
     def run(self):
-        while self.running:
-            now = time.time()
-            if self.gpio_available:
-                if self.coin_pulse_count > 0 and (now - self.coin_last_pulse_time > self.COIN_TIMEOUT):
-                    coin_value = self.get_coin_value(self.coin_pulse_count)
-                    if coin_value > 0:
-                        self.coin_inserted.emit(coin_value)
-                    self.coin_pulse_count = 0
-                if self.bill_pulse_count > 0 and (now - self.bill_last_pulse_time > self.PULSE_TIMEOUT):
-                    bill_value = self.get_bill_value(self.bill_pulse_count)
-                    if bill_value > 0:
-                        self.bill_inserted.emit(bill_value)
-                    self.bill_pulse_count = 0
-            time.sleep(0.05)
+        # Coins and bills are finalized from the pigpio watchdog callbacks; the thread
+        # only needs an event loop until stop() quits it
+        self.exec_()
 
     def stop(self):
         """Stop the GPIO thread safely."""
         print("Stopping GPIO payment thread...")
         self.running = False
         
-        # Give the thread a moment to finish its current iteration
+        # Leave the event loop started in run()
         if self.isRunning():
+            self.quit()
             self.wait(1000)  # Wait up to 1 second for graceful shutdown
         
         if self.gpio_available and self.pi:
             try:
+                self.pi.set_watchdog(self.COIN_PIN, 0)
+                self.pi.set_watchdog(self.BILL_PIN, 0)
+                # pi.write is acknowledged by pigpiod, so the inhibit line is
+                # already set when this returns
                 self.set_acceptor_state(False)
-                # Add a small delay to ensure the acceptor is properly disabled
-                import time
-                time.sleep(0.1)
                 self.pi.stop()
             except Exception as e:
                 print(f"Error stopping GPIO: {e}")
@@ -166,7 +204,7 @@ class PaymentModel(QObject):
     """Model for the Payment screen - handles payment logic, GPIO, and change dispensing."""
     
     # Signals for UI updates
-    payment_data_updated = pyqtSignal(dict)  # payment_data
+    payment_data_updated = pyqtSignal(object)  # PaymentSummary
     payment_status_updated = pyqtSignal(str)  # status_message
     suggestion_updated = pyqtSignal(str)      # inline best payment suggestion
     amount_received_updated = pyqtSignal(float)  # amount_received
@@ -176,6 +214,11 @@ class PaymentModel(QObject):
     payment_button_enabled = pyqtSignal(bool)  # enable/disable payment button
     payment_mode_changed = pyqtSignal(bool)  # payment mode enabled/disabled
     
+    SUGGESTION_CACHE_SIZE = 64
+    SUGGESTION_DEBOUNCE_MS = 150
+    UI_FLUSH_MS = 30
+    DISPENSE_STOP_WAIT_MS = 200
+    
     def __init__(self, main_app=None):
         super().__init__()
         self.db_manager = DatabaseManager()
@@ -184,21 +227,67 @@ class PaymentModel(QObject):
         self.total_cost = 0
         self.amount_received = 0
         self.payment_data = None
-        self.cash_received = {}
+        self.cash_received = _new_cash_counts()
         self.payment_processing = False
         self.payment_ready = False
         self.gpio_thread = None
-        self.dispense_thread = None
+        self.dispense_task = None
+        # Lives for the whole process; owns the pigpio handles for the hoppers
         self.change_dispenser = ChangeDispenser()
+        # One long-lived pool thread runs every dispense; results carry their task
+        self._dispense_pool = QThreadPool(self)
+        self._dispense_pool.setMaxThreadCount(1)
+        self._dispense_pool.setExpiryTimeout(-1)
+        self._dispense_signals = DispenseSignals()
+        self._dispense_signals.status_update.connect(self._on_dispense_status)
+        self._dispense_signals.dispensing_finished.connect(self._on_dispense_task_finished)
+        self.persistent_gpio = None
+        self._gpio_connected = False
+        self._payment_completing = False
+        self._printing_started = False
+        self.payment_info = None
+        self.transaction_data = None
+        self.change_dispensed = {}  # {denomination: count} handed out as change
+        self.payment_suggestions = []
+        
+        # Print-related attributes
+        self.print_file_path = None
+        self.selected_pages = None
+        self.copies = 1
+        self.color_mode = "Color"
         self.best_payment_suggestion = None  # {'amount', 'change', 'reason'}
+        # Best-payment results keyed on (total_cost, inventory version)
+        self._suggestion_cache = OrderedDict()
+        self._inv_version = 0
+        # Coalesces bursts of inserts into one suggestion refresh
+        self._suggest_timer = QTimer(self)
+        self._suggest_timer.setSingleShot(True)
+        self._suggest_timer.setInterval(self.SUGGESTION_DEBOUNCE_MS)
+        self._suggest_timer.timeout.connect(self._recompute_suggestion)
+        # Batches the per-insert UI signals so a burst of coins repaints once
+        self._pending_insert_message = None
+        self._ui_flush_timer = QTimer(self)
+        self._ui_flush_timer.setSingleShot(True)
+        self._ui_flush_timer.setInterval(self.UI_FLUSH_MS)
+        self._ui_flush_timer.timeout.connect(self._flush_ui)
+        # Last arguments sent on the change/button/suggestion signals, by key
+        self._last_emitted = {}
+        # Dispense-path status messages; only the last one per event-loop tick is shown
+        self._pending_status = None
+        self._status_timer = QTimer(self)
+        self._status_timer.setSingleShot(True)
+        self._status_timer.setInterval(0)
+        self._status_timer.timeout.connect(self._flush_status)
         
     def set_payment_data(self, payment_data):
         """Sets the payment data and initializes payment state."""
         self.payment_data = payment_data
         self.total_cost = payment_data['total_cost']
         self.amount_received = 0
-        self.cash_received = {}
+        self.cash_received = _new_cash_counts()
+        self.change_dispensed = {}
         self.payment_ready = False
+        self._printing_started = False
         
         # Extract print-related attributes for later use
         if 'pdf_data' in payment_data and 'path' in payment_data['pdf_data']:
@@ -210,116 +299,161 @@ class PaymentModel(QObject):
         if 'color_mode' in payment_data:
             self.color_mode = payment_data['color_mode']
         
-        print(f"DEBUG: Print attributes set - file: {self.print_file_path}, pages: {self.selected_pages}, copies: {self.copies}, mode: {self.color_mode}")
+        if _DEBUG:
+            print(f"DEBUG: Print attributes set - file: {self.print_file_path}, pages: {self.selected_pages}, copies: {self.copies}, mode: {self.color_mode}")
 
-        # Compute best payment suggestion inline based on current coin inventory
-        try:
-            best = self.payment_algorithm.find_best_payment_amount(self.total_cost)
-            self.best_payment_suggestion = best
-            # Notify UI to show suggestion inline
-            self.suggestion_updated.emit(self._format_best_payment_status())
-        except Exception as e:
-            print(f"Error computing best payment suggestion: {e}")
+        # Compute best payment suggestion inline based on current coin inventory.
+        # The inventory may have changed since the last session (admin refills,
+        # post-print updates), so start this one with a fresh cache.
+        self._invalidate_suggestions()
+        self._suggest_timer.start()
         
         # Prepare summary data for UI
         analysis = payment_data.get('analysis', {})
         pricing_info = analysis.get('pricing', {})
         b_count = pricing_info.get('black_pages_count', 0)
         c_count = pricing_info.get('color_pages_count', 0)
-        doc_name = os.path.basename(payment_data['pdf_data']['path'])
         
-        summary_data = {
-            'total_cost': self.total_cost,
-            'document_name': doc_name,
-            'copies': payment_data['copies'],
-            'color_mode': payment_data['color_mode'],
-            'black_pages': b_count,
-            'color_pages': c_count
+        # Derived values reused when the payment completes
+        # (basename and page_count are normally filled in by print options)
+        self._pdf_data = pdf_data = payment_data['pdf_data']
+        if 'basename' not in pdf_data:
+            pdf_data['basename'] = os.path.basename(pdf_data['path'])
+        if 'page_count' not in payment_data:
+            payment_data['page_count'] = len(payment_data.get('selected_pages', []))
+        self._doc_name = pdf_data['basename']
+        self._selected_pages_len = payment_data['page_count']
+        # Job fields of a cancelled-payment log entry, so Back only adds the amounts
+        self._log_meta = {
+            'file_name': self._doc_name or "unknown.pdf",
+            'pages': self._selected_pages_len or 0,
+            'copies': int(payment_data.get('copies') or 1),
+            'color_mode': payment_data.get('color_mode') or 'Color',
         }
         
+        summary_data = PaymentSummary(
+            total_cost=self.total_cost,
+            document_name=self._doc_name,
+            copies=self.copies,
+            color_mode=self.color_mode,
+            black_pages=b_count,
+            color_pages=c_count
+        )
+        
         self.payment_data_updated.emit(summary_data)
         self.payment_status_updated.emit("Click 'Enable Payment' to begin")
     
     def setup_gpio(self):
         """Setup persistent GPIO for payment processing."""
-        print("DEBUG: setup_gpio() method called")
+        if _DEBUG:
+            print("DEBUG: setup_gpio() method called")
         # Use persistent GPIO service instead of creating new thread
-        print("DEBUG: About to call get_persistent_gpio()")
+        if _DEBUG:
+            print("DEBUG: About to call get_persistent_gpio()")
         self.persistent_gpio = get_persistent_gpio()
-        print(f"DEBUG: Persistent GPIO obtained: {self.persistent_gpio}")
-        print(f"DEBUG: Persistent GPIO enabled: {getattr(self.persistent_gpio, 'enabled', 'N/A')}")
-        print(f"DEBUG: Persistent GPIO available: {getattr(self.persistent_gpio, 'gpio_available', 'N/A')}")
-        
-        print("DEBUG: About to connect signals")
-        self.persistent_gpio.coin_inserted.connect(self.on_coin_inserted)
-        self.persistent_gpio.bill_inserted.connect(self.on_bill_inserted)
-        self.persistent_gpio.payment_status.connect(self.payment_status_updated.emit)
-        print("DEBUG: Signals connected successfully")
-        
-        # Setup coin timeout timer for persistent GPIO
-        from PyQt5.QtCore import QTimer
-        self.coin_timeout_timer = QTimer()
-        self.coin_timeout_timer.timeout.connect(self.persistent_gpio.process_coin_timeout)
-        self.coin_timeout_timer.start(100)  # Check every 100ms
-        print("DEBUG: Coin timeout timer started")
+        if _DEBUG:
+            print(f"DEBUG: Persistent GPIO obtained: {self.persistent_gpio}")
+            print(f"DEBUG: Persistent GPIO enabled: {getattr(self.persistent_gpio, 'enabled', 'N/A')}")
+            print(f"DEBUG: Persistent GPIO available: {getattr(self.persistent_gpio, 'gpio_available', 'N/A')}")
+        
+        # The GPIO service is a singleton that outlives this screen, so connect
+        # only once; reconnecting on every enter would deliver each coin N times
+        if not self._gpio_connected:
+            if _DEBUG:
+                print("DEBUG: About to connect signals")
+            self.persistent_gpio.coin_inserted.connect(self.on_coin_inserted)
+            self.persistent_gpio.bill_inserted.connect(self.on_bill_inserted)
+            self.persistent_gpio.payment_status.connect(self.payment_status_updated.emit)
+            self._gpio_connected = True
+            if _DEBUG:
+                print("DEBUG: Signals connected successfully")
+        # Coins and bills are finalized by the GPIO service's pigpio watchdogs;
+        # no timer is needed here
     
     def enable_payment_mode(self):
         """Enables payment mode."""
-        print(f"DEBUG: enable_payment_mode called, total_cost: {self.total_cost}")
+        if _DEBUG:
+            print(f"DEBUG: enable_payment_mode called, total_cost: {self.total_cost}")
         if self.total_cost <= 0:
-            print("DEBUG: Total cost is 0 or negative, not enabling payment")
+            if _DEBUG:
+                print("DEBUG: Total cost is 0 or negative, not enabling payment")
             return
-        
-        self.payment_ready = True
-        print(f"DEBUG: payment_ready set to True")
-        
-        print(f"DEBUG: Checking if persistent_gpio exists: {hasattr(self, 'persistent_gpio')}")
-        if hasattr(self, 'persistent_gpio'):
-            print(f"DEBUG: persistent_gpio value: {self.persistent_gpio}")
-            print(f"DEBUG: Calling persistent_gpio.enable_payment()")
-            self.persistent_gpio.enable_payment()
-            print("SUCCESS: Payment mode enabled via persistent GPIO")
-        else:
-            print("ERROR: No persistent GPIO available")
-        
-        status_text = "Payment mode enabled - Use simulation buttons" if not PAYMENT_GPIO_AVAILABLE else "Payment mode enabled - Insert coins or bills"
-        self.payment_status_updated.emit(status_text)
-        self.payment_mode_changed.emit(True)
+        self._set_payment_mode(True)
     
     def disable_payment_mode(self):
         """Disables payment mode."""
-        self.payment_ready = False
-        if hasattr(self, 'persistent_gpio'):
-            self.persistent_gpio.disable_payment()
-            print("SUCCESS: Payment mode disabled via persistent GPIO")
+        self._set_payment_mode(False)
+    
+    def _set_payment_mode(self, enabled):
+        """
+        Moves between accepting and not accepting cash: toggles the acceptors and
+        notifies the UI once per actual transition, so repeated calls are no-ops.
+        """
+        if self.payment_ready == enabled:
+            return
+        self.payment_ready = enabled
+        
+        if self.persistent_gpio is not None:
+            if enabled:
+                self.persistent_gpio.enable_payment()
+            else:
+                self.persistent_gpio.disable_payment()
+            print(f"SUCCESS: Payment mode {'enabled' if enabled else 'disabled'} via persistent GPIO")
         else:
             print("ERROR: No persistent GPIO available")
         
-        status_text = "Payment mode disabled" + (" (Simulation)" if not PAYMENT_GPIO_AVAILABLE else "")
-        self.payment_status_updated.emit(status_text)
-        self.payment_mode_changed.emit(False)
+        self.payment_status_updated.emit(_MODE_ENABLED_MSG if enabled else _MODE_DISABLED_MSG)
+        self.payment_mode_changed.emit(enabled)
     
     def on_coin_inserted(self, coin_value):
         """Handles coin insertion."""
         if not self.payment_ready:
             return
         
+        idx = _DENOM_IDX.get(coin_value)
+        if idx is None:
+            # Keep the total and the per-denomination counts in step
+            print(f"WARNING: Ignoring unknown coin value {coin_value}")
+            return
         self.amount_received += coin_value
-        self.cash_received[coin_value] = self.cash_received.get(coin_value, 0) + 1
-        self.amount_received_updated.emit(self.amount_received)
-        self._update_payment_status()
-        self.payment_status_updated.emit(f"P{coin_value} coin received")
+        self.cash_received[idx] += 1
+        self._pending_insert_message = f"P{coin_value} coin received"
+        self._ui_flush_timer.start()
     
     def on_bill_inserted(self, bill_value):
         """Handles bill insertion."""
         if not self.payment_ready:
             return
         
+        idx = _DENOM_IDX.get(bill_value)
+        if idx is None:
+            print(f"WARNING: Ignoring unknown bill value {bill_value}")
+            return
         self.amount_received += bill_value
-        self.cash_received[bill_value] = self.cash_received.get(bill_value, 0) + 1
+        self.cash_received[idx] += 1
+        self._pending_insert_message = f"P{bill_value} bill received"
+        self._ui_flush_timer.start()
+    
+    def _flush_ui(self):
+        """Publishes the state after the latest burst of inserts in one round of signals."""
+        message = self._pending_insert_message
+        if message is None:
+            return
+        self._pending_insert_message = None
         self.amount_received_updated.emit(self.amount_received)
         self._update_payment_status()
-        self.payment_status_updated.emit(f"P{bill_value} bill received")
+        self.payment_status_updated.emit(message)
+    
+    def _emit_changed(self, key, signal, *args):
+        """Emits signal(*args) unless the view already shows exactly these values."""
+        if self._last_emitted.get(key) != args:
+            self._last_emitted[key] = args
+            signal.emit(*args)
+    
+    def cash_received_counts(self):
+        """Returns the cash received so far as {denomination: count}, nonzero entries only."""
+        counts = self.cash_received
+        return {d: counts[i] for i, d in enumerate(_DENOMS) if counts[i]}
     
     def simulate_coin(self, value):
         """Simulates coin insertion for testing."""
@@ -333,19 +467,22 @@ class PaymentModel(QObject):
     
     def _update_payment_status(self):
         """Updates payment status and calculates change."""
+        # Nothing to pay for (e.g. between reset and the next set_payment_data)
+        if self.total_cost <= 0:
+            return
         try:
             # Prevent multiple automatic completions
-            if hasattr(self, '_payment_completing') and self._payment_completing:
+            if self._payment_completing:
                 print("WARNING: Payment already completing, ignoring duplicate trigger")
                 return
             
             if self.amount_received >= self.total_cost and self.total_cost > 0:
                 change = self.amount_received - self.total_cost
                 change_text = f"Payment Complete. Change: P{change:.2f}" if change > 0 else "Payment Complete"
-                self.change_updated.emit(change, change_text)
-                self.payment_button_enabled.emit(True)  # Enable payment button when sufficient payment
+                self._emit_changed('change', self.change_updated, change, change_text)
+                self._emit_changed('button', self.payment_button_enabled, True)  # Enable payment button when sufficient payment
                 
-                if self.payment_ready and not (hasattr(self, '_payment_completing') and self._payment_completing):
+                if self.payment_ready and not self._payment_completing:
                     self._payment_completing = True  # Prevent duplicate processing
                     self.payment_status_updated.emit("Payment sufficient - Processing automatically...")
                     self.disable_payment_mode()
@@ -354,21 +491,47 @@ class PaymentModel(QObject):
             else:
                 remaining = self.total_cost - self.amount_received
                 change_text = f"Remaining: P{remaining:.2f}"
-                self.change_updated.emit(0, change_text)
-                self.payment_button_enabled.emit(False)  # Disable payment button when insufficient payment
+                self._emit_changed('change', self.change_updated, 0, change_text)
+                self._emit_changed('button', self.payment_button_enabled, False)  # Disable payment button when insufficient payment
                 
         except Exception as e:
             print(f"ERROR: Error in payment status update: {e}")
             self.payment_status_updated.emit(f"Payment error: {str(e)}")
 
-        # Refresh inline suggestion each time status updates
+        # Refresh inline suggestion once the current burst of inserts settles;
+        # not needed once payment is complete or the screen is tearing down
+        if self.payment_ready:
+            self._suggest_timer.start()
+
+    def _recompute_suggestion(self):
+        """Recomputes the inline best payment suggestion and notifies the UI."""
+        if self.total_cost <= 0:
+            return
         try:
-            best = self.payment_algorithm.find_best_payment_amount(self.total_cost)
+            best = self._cached_best_payment(self.total_cost)
             self.best_payment_suggestion = best
-            self.suggestion_updated.emit(self._format_best_payment_status())
+            self._emit_changed('suggestion', self.suggestion_updated, self._format_best_payment_status())
         except Exception as e:
             print(f"Error refreshing best payment suggestion: {e}")
 
+    def _cached_best_payment(self, total_cost):
+        """Returns find_best_payment_amount(total_cost), reusing results until the inventory changes."""
+        key = (total_cost, self._inv_version)
+        best = self._suggestion_cache.get(key)
+        if best is None:
+            best = self.payment_algorithm.find_best_payment_amount(total_cost)
+            self._suggestion_cache[key] = best
+            if len(self._suggestion_cache) > self.SUGGESTION_CACHE_SIZE:
+                self._suggestion_cache.popitem(last=False)
+        else:
+            self._suggestion_cache.move_to_end(key)
+        return best
+    
+    def _invalidate_suggestions(self):
+        """Drops cached payment suggestions after the coin inventory changes."""
+        self._inv_version += 1
+        self._suggestion_cache.clear()
+
     def _format_best_payment_status(self) -> str:
         if not self.best_payment_suggestion:
             return ""
@@ -382,25 +545,26 @@ class PaymentModel(QObject):
         """Automatically complete payment when sufficient amount is received."""
         print("Auto-completing payment...")
         
-        # Show processing message
+        # Show processing message; it stays up while the hopper works
         self.payment_status_updated.emit("Dispensing change and preparing to print...")
         
-        # Add a small delay to show the processing message
-        from PyQt5.QtCore import QTimer
-        QTimer.singleShot(1500, self._proceed_with_payment)
+        # Yield to the event loop once so the message paints, then start dispensing
+        QTimer.singleShot(0, self._proceed_with_payment)
     
     def _proceed_with_payment(self):
         """Proceed with payment completion after delay."""
         print("Proceeding with payment completion...")
         
         # Check if we have main_app reference
-        if hasattr(self, 'main_app') and self.main_app:
+        if self.main_app is not None:
             # Call the existing complete_payment method
             success, message = self.complete_payment(self.main_app)
             if success:
                 print("SUCCESS: Auto-payment completion successful")
             else:
                 print(f"ERROR: Auto-payment completion failed: {message}")
+                # This attempt started nothing; clear the flag the auto trigger set
+                self._payment_completing = False
                 self.payment_status_updated.emit(f"Payment error: {message}")
         else:
             print("ERROR: No main_app reference available for auto-payment completion")
@@ -448,7 +612,7 @@ class PaymentModel(QObject):
             return False, f"Payment cannot be processed: {message}"
         
         # Check paper availability (without decrementing)
-        total_pages = len(self.payment_data['selected_pages']) * self.payment_data['copies']
+        total_pages = self._selected_pages_len * self.copies
         admin_screen = main_app.admin_screen
         if not admin_screen.check_paper_availability(total_pages):
             return False, f"Not enough paper to complete print job.\nRequired: {total_pages} sheets. Please contact administrator to refill paper."
@@ -458,10 +622,10 @@ class PaymentModel(QObject):
         
         # Store transaction data for logging after successful printing
         self.transaction_data = {
-            'file_name': os.path.basename(self.payment_data['pdf_data']['path']),
-            'pages': len(self.payment_data['selected_pages']),
-            'copies': self.payment_data['copies'],
-            'color_mode': self.payment_data['color_mode'],
+            'file_name': self._doc_name,
+            'pages': self._selected_pages_len,
+            'copies': self.copies,
+            'color_mode': self.color_mode,
             'total_cost': self.total_cost,
             'amount_paid': self.amount_received,
             'change_given': change_amount,
@@ -469,103 +633,117 @@ class PaymentModel(QObject):
         }
         
         # Update cash inventory - add received coins to existing inventory
-        for denomination, count in self.cash_received.items():
-            if count > 0:
-                # Get current inventory count
-                current_inventory = self.db_manager.get_cash_inventory()
-                current_count = 0
-                
-                for item in current_inventory:
-                    if (item.get('denomination') == denomination and 
-                        item.get('type') == ('bill' if denomination >= 20 else 'coin')):
-                        current_count = item.get('count', 0)
-                        break
-                
-                # Add received coins to current count
-                new_count = current_count + count
-                
-                self.db_manager.update_cash_inventory(
-                    denomination=denomination, 
-                    count=new_count, 
-                    type='bill' if denomination >= 20 else 'coin'
-                )
-                
-                print(f"💰 Added {count} x {denomination} to inventory: {current_count} + {count} = {new_count}")
+        current_inventory = {
+            (item.get('type'), item.get('denomination')): item.get('count', 0)
+            for item in self.db_manager.get_cash_inventory()
+        }
+        rows = []
+        for i, denomination in enumerate(_DENOMS):
+            count = self.cash_received[i]
+            if not count:
+                continue
+            cash_type = _DENOM_KIND[i]
+            current_count = current_inventory.get((cash_type, denomination), 0)
+            new_count = current_count + count
+            rows.append((denomination, new_count, cash_type))
+            print(f"💰 Added {count} x {denomination} to inventory: {current_count} + {count} = {new_count}")
+        self.db_manager.update_cash_inventory_bulk(rows)
         
         # Store payment info for later emission (after hopper dispensing and printing)
         self.payment_info = {
-            'pdf_data': self.payment_data['pdf_data'],
-            'selected_pages': self.payment_data['selected_pages'],
-            'color_mode': self.payment_data['color_mode'],
-            'copies': self.payment_data['copies'],
+            'pdf_data': self._pdf_data,
+            'selected_pages': self.selected_pages,
+            'color_mode': self.color_mode,
+            'copies': self.copies,
             'total_cost': self.total_cost,
             'amount_received': self.amount_received,
             'change': change_amount,
             'payment_method': 'Cash' if PAYMENT_GPIO_AVAILABLE else 'Simulation'
         }
         
-        print("DEBUG: Payment info stored, will emit after hopper dispensing and printing complete")
+        if _DEBUG:
+            print("DEBUG: Payment info stored, will emit after hopper dispensing and printing complete")
         
         # NEW FLOW: Handle change dispensing FIRST, then print
         if change_amount > 0:
-            print(f"DEBUG: Starting change dispensing for P{change_amount:.2f}")
+            if _DEBUG:
+                print(f"DEBUG: Starting change dispensing for P{change_amount:.2f}")
             self.payment_status_updated.emit(f"Please wait... Dispensing change: P{change_amount:.2f}")
-            print("DEBUG: Payment screen will stay active during hopper dispensing")
+            if _DEBUG:
+                print("DEBUG: Payment screen will stay active during hopper dispensing")
             
-            # Ensure change dispenser is available
-            if not hasattr(self, 'change_dispenser') or self.change_dispenser is None:
-                print("DEBUG: Change dispenser not available, creating new one")
-                self.change_dispenser = ChangeDispenser()
+            assert self.change_dispenser is not None, "change_dispenser must be initialized"
             
-            # Get admin screen from main_app to pass to dispense thread
-            admin_screen = None
-            if hasattr(self, 'main_app') and hasattr(self.main_app, 'admin_screen'):
-                admin_screen = self.main_app.admin_screen
-                print(f"DEBUG: Admin screen found: {admin_screen}")
+            # Get admin screen from main_app to pass to dispense task
+            admin_screen = self._app_service('admin_screen')
+            if admin_screen is not None:
+                if _DEBUG:
+                    print(f"DEBUG: Admin screen found: {admin_screen}")
             else:
-                print("DEBUG: No admin screen found")
+                if _DEBUG:
+                    print("DEBUG: No admin screen found")
             
             # Get database thread manager from main_app
-            db_threader = None
-            if hasattr(self, 'main_app') and hasattr(self.main_app, 'db_threader'):
-                db_threader = self.main_app.db_threader
-                print(f"DEBUG: Database threader found: {db_threader}")
+            db_threader = self._app_service('db_threader')
+            if db_threader is not None:
+                if _DEBUG:
+                    print(f"DEBUG: Database threader found: {db_threader}")
             else:
-                print("DEBUG: No database threader found")
+                if _DEBUG:
+                    print("DEBUG: No database threader found")
             
-            self.dispense_thread = DispenseThread(
+            self.dispense_task = DispenseTask(
                 self.change_dispenser, 
                 change_amount, 
+                self._dispense_signals,
                 admin_screen, 
                 db_threader
             )
-            self.dispense_thread.status_update.connect(self.payment_status_updated.emit)
-            self.dispense_thread.dispensing_finished.connect(self._on_dispensing_finished)
-            self.dispense_thread.start()
-            print("DEBUG: Dispense thread started")
+            self._dispense_pool.start(self.dispense_task)
+            if _DEBUG:
+                print("DEBUG: Dispense task started")
         else:
-            print("DEBUG: No change to dispense, starting printing directly")
+            if _DEBUG:
+                print("DEBUG: No change to dispense, starting printing directly")
             self._start_printing()
         
         return True, "Payment completed successfully"
     
-    def log_transaction_after_print_success(self):
-        """Log the transaction to database after successful printing."""
-        if hasattr(self, 'transaction_data') and self.transaction_data:
-            try:
-                self.db_manager.log_transaction(self.transaction_data)
-                print(f"✅ Transaction logged successfully: {self.transaction_data['file_name']}")
-            except Exception as e:
-                print(f"❌ Error logging transaction: {e}")
-        else:
+    def log_transaction_after_print_success(self, cash_changes=None):
+        """
+        Log the transaction to database after successful printing.
+        
+        cash_changes, if given, is {denomination: signed count} applied to the
+        cash inventory in the same commit as the transaction.
+        """
+        transaction_data = self.transaction_data
+        # cash_changes already subtract this job's change; don't let a later job reuse it
+        self.change_dispensed = {}
+        if not transaction_data:
             print("⚠️ No transaction data available to log")
+            if not cash_changes:
+                return
+        try:
+            # Hand the write to the database thread so the UI never waits on the commit
+            db_threader = self._app_service('db_threader')
+            if db_threader is not None:
+                db_threader.log_transaction_and_add_cash(transaction_data, cash_changes or {})
+            else:
+                self.db_manager.log_transaction_and_add_cash(transaction_data, cash_changes or {})
+            if transaction_data:
+                print(f"✅ Transaction logged successfully: {transaction_data['file_name']}")
+        except Exception as e:
+            print(f"❌ Error logging transaction: {e}")
+        if cash_changes:
+            self._invalidate_suggestions()
     
     # Print job signals are now handled by the thank you screen
     # No need to connect them here since the thank you screen will manage the entire print lifecycle
     
     def _on_dispensing_finished(self, result):
         """Handles the completion of change dispensing."""
-        print(f"DEBUG: _on_dispensing_finished called with result={result}")
+        if _DEBUG:
+            print(f"DEBUG: _on_dispensing_finished called with result={result}")
         
         try:
             if isinstance(result, dict) and result.get('success', False):
@@ -575,26 +753,32 @@ class PaymentModel(QObject):
                 actual_change = result.get('actual_change', 0)
                 expected_change = result.get('expected_change', 0)
                 
-                print(f"DEBUG: Change dispensing completed - P1={coins_1}, P5={coins_5}, actual={actual_change}, expected={expected_change}")
-                self.payment_status_updated.emit(f"Change dispensed! Updating inventory...")
+                if _DEBUG:
+                    print(f"DEBUG: Change dispensing completed - P1={coins_1}, P5={coins_5}, actual={actual_change}, expected={expected_change}")
+                self._post_status(f"Change dispensed! Updating inventory...")
                 
                 # Store dispensed change data for later database update
                 self.change_dispensed = {1: coins_1, 5: coins_5}
-                print(f"DEBUG: Stored dispensed change data: {self.change_dispensed}")
+                if _DEBUG:
+                    print(f"DEBUG: Stored dispensed change data: {self.change_dispensed}")
                 
                 # Update database with actual coins dispensed
-                if hasattr(self, 'main_app') and self.main_app and hasattr(self.main_app, 'db_threader') and self.main_app.db_threader:
-                    print("DEBUG: Updating coin inventory in database...")
-                    self.main_app.db_threader.update_coin_inventory(
+                db_threader = self._app_service('db_threader')
+                if db_threader is not None:
+                    if _DEBUG:
+                        print("DEBUG: Updating coin inventory in database...")
+                    db_threader.update_coin_inventory(
                         coins_1, coins_5, 
                         callback=self._on_coin_inventory_updated
                     )
                 else:
-                    print("DEBUG: No database thread manager available, proceeding to print")
+                    if _DEBUG:
+                        print("DEBUG: No database thread manager available, proceeding to print")
                     self._start_printing()
             else:
                 # Fallback for old boolean format
-                print(f"DEBUG: Old format result: {result}")
+                if _DEBUG:
+                    print(f"DEBUG: Old format result: {result}")
                 if result:
                     print("Dispensing complete.")
                     self._start_printing()
@@ -606,49 +790,90 @@ class PaymentModel(QObject):
             # Fallback to navigation even if there's an error
             self._navigate_to_thank_you()
         
-        # Clean up change dispenser after dispensing is complete
+        # Switch the hoppers off after dispensing; the dispenser is reused for future transactions
         try:
-            if hasattr(self, 'change_dispenser') and self.change_dispenser:
-                print("DEBUG: Cleaning up change dispenser after dispensing complete")
-                self.change_dispenser.cleanup()
-                # Don't set to None here as it might be needed for future transactions
+            if self.change_dispenser is not None:
+                if _DEBUG:
+                    print("DEBUG: Disabling hoppers after dispensing complete")
+                self.change_dispenser.disable_all_hoppers()
         except Exception as e:
-            print(f"DEBUG: Error cleaning up change dispenser: {e}")
+            if _DEBUG:
+                print(f"DEBUG: Error cleaning up change dispenser: {e}")
         
-        # Clean up the dispense thread
+        # Clean up the dispense task
         try:
-            if hasattr(self, 'dispense_thread') and self.dispense_thread:
-                print("DEBUG: Cleaning up dispense thread after completion")
-                if self.dispense_thread.isRunning():
-                    self.dispense_thread.terminate()
-                    self.dispense_thread.wait(1000)
-                self.dispense_thread = None
+            if self.dispense_task is not None:
+                if _DEBUG:
+                    print("DEBUG: Cleaning up dispense task after completion")
+                self._stop_dispense_task()
         except Exception as e:
-            print(f"DEBUG: Error cleaning up dispense thread: {e}")
+            if _DEBUG:
+                print(f"DEBUG: Error cleaning up dispense task: {e}")
+    
+    def _app_service(self, name):
+        """Returns a main_app attribute such as db_threader or admin_screen, or None."""
+        return getattr(self.main_app, name, None)
+    
+    def _stop_dispense_task(self):
+        """
+        Asks the dispense task to stop between coins and drops our reference to it.
+        Returns True if it is still finishing the coin in flight.
+        """
+        task = self.dispense_task
+        self.dispense_task = None
+        if task is None or not task.is_running():
+            return False
+        # Results from a dropped task are ignored, so a cancelled dispense never starts printing
+        task.stop()
+        return not task.wait(self.DISPENSE_STOP_WAIT_MS)
+    
+    def _post_status(self, message):
+        """Queues a status message; back-to-back messages repaint the label once."""
+        self._pending_status = message
+        self._status_timer.start()
+    
+    def _flush_status(self):
+        message, self._pending_status = self._pending_status, None
+        if message is not None:
+            self.payment_status_updated.emit(message)
+    
+    def _on_dispense_status(self, task, message):
+        if task is self.dispense_task:
+            self._post_status(message)
+    
+    def _on_dispense_task_finished(self, task, result):
+        if task is self.dispense_task:
+            self._on_dispensing_finished(result)
     
     def _on_coin_inventory_updated(self, operation):
         """Handles the completion of coin inventory update."""
-        print(f"DEBUG: Coin inventory updated: {operation.result}")
+        if _DEBUG:
+            print(f"DEBUG: Coin inventory updated: {operation.result}")
+        self._invalidate_suggestions()
         if operation.error:
             print(f"ERROR: Failed to update coin inventory: {operation.error}")
-            self.payment_status_updated.emit("Inventory update failed, but continuing...")
+            self._post_status("Inventory update failed, but continuing...")
         else:
-            print("DEBUG: Coin inventory successfully updated")
-            self.payment_status_updated.emit("Inventory updated successfully!")
+            if _DEBUG:
+                print("DEBUG: Coin inventory successfully updated")
+            self._post_status("Inventory updated successfully!")
         
         # Store print job details in main app for thank you screen to access
-        if hasattr(self, 'main_app') and hasattr(self, 'print_file_path'):
-            print("DEBUG: Storing print job details in main app...")
+        if self.main_app is not None:
+            if _DEBUG:
+                print("DEBUG: Storing print job details in main app...")
             self.main_app.current_print_job = {
                 'file_path': self.print_file_path,
                 'selected_pages': self.selected_pages,
                 'copies': self.copies,
                 'color_mode': self.color_mode
             }
-            print(f"DEBUG: Print job details stored: {self.main_app.current_print_job}")
+            if _DEBUG:
+                print(f"DEBUG: Print job details stored: {self.main_app.current_print_job}")
         
         # Navigate directly to thank you screen after change dispensing
-        print("DEBUG: Change dispensing complete, navigating to thank you screen...")
+        if _DEBUG:
+            print("DEBUG: Change dispensing complete, navigating to thank you screen...")
         self._navigate_to_thank_you()
     
     
@@ -660,106 +885,117 @@ class PaymentModel(QObject):
     
     def _navigate_to_thank_you(self):
         """Navigate to thank you screen after all operations are complete."""
-        print("DEBUG: _navigate_to_thank_you called")
-        print("DEBUG: Current thread:", threading.current_thread().name)
-        print("DEBUG: main_app available:", hasattr(self, 'main_app') and self.main_app is not None)
+        if _DEBUG:
+            print("DEBUG: _navigate_to_thank_you called")
+            print("DEBUG: Current thread:", threading.current_thread().name)
+            print("DEBUG: main_app available:", self.main_app is not None)
         
         try:
             # Emit payment completed signal now that everything is done
-            if hasattr(self, 'payment_info') and self.payment_info:
-                print("DEBUG: Emitting payment_completed signal with stored payment info")
+            if self.payment_info:
+                if _DEBUG:
+                    print("DEBUG: Emitting payment_completed signal with stored payment info")
                 self.payment_completed.emit(self.payment_info)
             else:
-                print("DEBUG: No payment info available to emit")
+                if _DEBUG:
+                    print("DEBUG: No payment info available to emit")
             
-            if hasattr(self, 'main_app') and self.main_app:
-                print("DEBUG: Navigating to thank you screen")
+            if self.main_app is not None:
+                if _DEBUG:
+                    print("DEBUG: Navigating to thank you screen")
                 self.main_app.show_screen('thank_you')
-                print("DEBUG: Navigation to thank you screen completed")
+                if _DEBUG:
+                    print("DEBUG: Navigation to thank you screen completed")
             else:
-                print("DEBUG: No main_app available for navigation")
+                if _DEBUG:
+                    print("DEBUG: No main_app available for navigation")
         except Exception as e:
             print(f"ERROR: Exception in _navigate_to_thank_you: {e}")
             # Try to navigate anyway as a fallback
             try:
-                if hasattr(self, 'main_app') and self.main_app:
+                if self.main_app is not None:
                     self.main_app.show_screen('thank_you')
             except Exception as fallback_error:
                 print(f"ERROR: Fallback navigation also failed: {fallback_error}")
     
     def on_enter(self):
         """Called when the payment screen is shown."""
-        print("=== PAYMENT MODEL ON_ENTER START ===")
-        print("Payment screen entered")
-        print("DEBUG: About to call setup_gpio()")
+        if _DEBUG:
+            print("=== PAYMENT MODEL ON_ENTER START ===")
+            print("Payment screen entered")
+            print("DEBUG: About to call setup_gpio()")
         try:
             self.setup_gpio()
-            print("DEBUG: setup_gpio() completed successfully")
+            if _DEBUG:
+                print("DEBUG: setup_gpio() completed successfully")
         except Exception as e:
-            print(f"DEBUG: setup_gpio() failed with error: {e}")
+            if _DEBUG:
+                print(f"DEBUG: setup_gpio() failed with error: {e}")
         
         # Reset payment state
         self.amount_received = 0
-        self.cash_received = {}
+        self.cash_received = _new_cash_counts()
+        self.change_dispensed = {}
         self.payment_processing = False
         
         self.amount_received_updated.emit(0)
-        self.change_updated.emit(0, "")
+        self._emit_changed('change', self.change_updated, 0, "")
         
         # Automatically enable payment mode
-        print("DEBUG: About to call enable_payment_mode()")
+        if _DEBUG:
+            print("DEBUG: About to call enable_payment_mode()")
         self.enable_payment_mode()
-        print("=== PAYMENT MODEL ON_ENTER END ===")
+        if _DEBUG:
+            print("=== PAYMENT MODEL ON_ENTER END ===")
     
     def on_leave(self):
         """Called when leaving the payment screen."""
-        print("=== PAYMENT MODEL ON_LEAVE START ===")
-        print("Payment screen leaving")
-        
-        # Stop coin timeout timer
-        if hasattr(self, 'coin_timeout_timer') and self.coin_timeout_timer is not None:
-            self.coin_timeout_timer.stop()
-            self.coin_timeout_timer = None
-            print("DEBUG: Coin timeout timer stopped")
+        if _DEBUG:
+            print("=== PAYMENT MODEL ON_LEAVE START ===")
+            print("Payment screen leaving")
+        self._suggest_timer.stop()
+        self._ui_flush_timer.stop()
+        self._pending_insert_message = None
+        self._status_timer.stop()
+        self._pending_status = None
         
         # Disable payment but keep persistent GPIO running for other screens
-        if hasattr(self, 'persistent_gpio'):
-            print("DEBUG: About to call persistent_gpio.disable_payment()")
+        self.payment_ready = False
+        if self.persistent_gpio is not None:
+            if _DEBUG:
+                print("DEBUG: About to call persistent_gpio.disable_payment()")
             self.persistent_gpio.disable_payment()
-            print("DEBUG: persistent_gpio.disable_payment() completed")
+            if _DEBUG:
+                print("DEBUG: persistent_gpio.disable_payment() completed")
             print("Persistent GPIO payment disabled (but GPIO kept alive for other screens)")
         else:
             print("ERROR: No persistent_gpio available to disable payment")
         
         # Payment is already disabled by persistent GPIO
-        print("Payment screen cleanup completed")
+        if _DEBUG:
+            print("Payment screen cleanup completed")
         
-        # Stop any running dispense thread
-        if hasattr(self, 'dispense_thread') and self.dispense_thread:
-            print("Stopping dispense thread...")
+        # Stop any running dispense task
+        still_dispensing = False
+        if self.dispense_task is not None:
+            print("Stopping dispense task...")
             try:
-                if self.dispense_thread.isRunning():
-                    self.dispense_thread.terminate()
-                    self.dispense_thread.wait(1000)
+                still_dispensing = self._stop_dispense_task()
             except Exception as e:
-                print(f"Error stopping dispense thread: {e}")
-            finally:
-                # Clear the thread reference
-                self.dispense_thread = None
-        
-        # Clean up change dispenser if it exists and is not being used
-        if hasattr(self, 'change_dispenser') and self.change_dispenser:
-            # Check if there's an active dispense thread
-            if hasattr(self, 'dispense_thread') and self.dispense_thread and self.dispense_thread.isRunning():
-                print("Payment screen: Skipping change dispenser cleanup - dispense thread still running")
+                print(f"Error stopping dispense task: {e}")
+                self.dispense_task = None
+        
+        # Switch the hoppers off if they are not being used; the dispenser itself
+        # is kept for the next payment
+        if self.change_dispenser is not None:
+            # Check if a coin is still being dispensed
+            if still_dispensing:
+                print("Payment screen: Skipping hopper shutdown - dispense task still running")
             else:
                 try:
-                    print("Cleaning up change dispenser...")
-                    self.change_dispenser.cleanup()
+                    self.change_dispenser.disable_all_hoppers()
                 except Exception as e:
-                    print(f"Error cleaning up change dispenser: {e}")
-                finally:
-                    self.change_dispenser = None
+                    print(f"Error disabling hoppers: {e}")
     
     def _log_partial_payment(self):
         """Log partial payment when user cancels transaction."""
@@ -767,49 +1003,27 @@ class PaymentModel(QObject):
             if not (self.amount_received and self.payment_data):
                 return
 
-            # Defensive guards for keys
-            pdf_data = self.payment_data.get('pdf_data') or {}
-            file_path = pdf_data.get('path') or "unknown.pdf"
-            selected_pages = self.payment_data.get('selected_pages') or []
-            copies = int(self.payment_data.get('copies') or 1)
-            color_mode = self.payment_data.get('color_mode') or 'Color'
-
             # Log cancelled transaction with partial payment
             transaction_data = {
-                'file_name': os.path.basename(file_path),
-                'pages': len(selected_pages),
-                'copies': copies,
-                'color_mode': color_mode,
+                **self._log_meta,
                 'total_cost': float(self.total_cost or 0),
                 'amount_paid': float(self.amount_received or 0),
                 'change_given': 0,  # No change given since transaction cancelled
                 'status': 'cancelled_partial_payment'
             }
+            # Add the received money to the cash inventory (do not overwrite totals).
+            # The database thread does the read-modify-write so Back navigates at once.
+            cash_counts = self.cash_received_counts()
+            db_threader = self._app_service('db_threader')
             try:
-                self.db_manager.log_transaction(transaction_data)
+                if db_threader is not None:
+                    db_threader.log_transaction_and_add_cash(transaction_data, cash_counts)
+                else:
+                    self.db_manager.log_transaction_and_add_cash(transaction_data, cash_counts)
             except Exception as log_err:
                 print(f"WARNING: Failed to log cancelled transaction: {log_err}")
-
-            # Safely increment cash inventory with received money (do not overwrite totals)
-            try:
-                current_inventory = {}
-                for item in (self.db_manager.get_cash_inventory() or []):
-                    if item.get('type') == 'coin' or item.get('type') == 'bill':
-                        current_inventory[(item.get('type'), int(item.get('denomination')))] = int(item.get('count') or 0)
-
-                for denomination, count in (self.cash_received or {}).items():
-                    if not count:
-                        continue
-                    is_bill = denomination >= 20
-                    key = ('bill' if is_bill else 'coin', int(denomination))
-                    new_count = current_inventory.get(key, 0) + int(count)
-                    self.db_manager.update_cash_inventory(
-                        denomination=int(denomination),
-                        count=new_count,
-                        type='bill' if is_bill else 'coin'
-                    )
-            except Exception as inv_err:
-                print(f"WARNING: Failed to update cash inventory on cancel: {inv_err}")
+            if cash_counts:
+                self._invalidate_suggestions()
 
             print(f"Logged cancelled transaction: {self.amount_received} received, {self.total_cost} required")
         except Exception as e:
@@ -817,132 +1031,145 @@ class PaymentModel(QObject):
 
     def complete_payment(self, main_app):
         """Complete the payment process - dispense change and start printing."""
-        print("Starting payment completion process...")
+        # A second call while change is dispensing or the job is printing is a no-op;
+        # the first call's dispense task must not be stopped and restarted
+        task = self.dispense_task
+        if (task is not None and task.is_running()) or self._printing_started:
+            print("WARNING: Payment completion already in progress")
+            return False, "Already processing"
+        if _DEBUG:
+            print("Starting payment completion process...")
         
-        try:
-            # Validate payment data exists
-            if not hasattr(self, 'payment_data') or self.payment_data is None:
-                print("ERROR: No payment data available")
-                return False, "No payment data available"
-            
-            # Validate main_app reference
-            if not main_app:
-                print("ERROR: No main app reference")
-                return False, "No main app reference"
-            
-            # Calculate change to dispense
-            change_amount = self.amount_received - self.total_cost
+        # Validate payment data exists
+        if self.payment_data is None:
+            print("ERROR: No payment data available")
+            return False, "No payment data available"
+        
+        # Validate main_app reference
+        if not main_app:
+            print("ERROR: No main app reference")
+            return False, "No main app reference"
+        
+        # Calculate change to dispense
+        change_amount = self.amount_received - self.total_cost
+        if _DEBUG:
             print(f"Change to dispense: P{change_amount:.2f}")
-            
-            # Stop any existing dispense thread to prevent conflicts
-            if hasattr(self, 'dispense_thread') and self.dispense_thread and self.dispense_thread.isRunning():
-                print("WARNING: Stopping existing dispense thread")
-                self.dispense_thread.terminate()
-                self.dispense_thread.wait(1000)
-                self.dispense_thread = None
-            
-            # Create change dispenser if not exists
-            if not hasattr(self, 'change_dispenser') or self.change_dispenser is None:
-                from managers.hopper_manager import ChangeDispenser
-                self.change_dispenser = ChangeDispenser()
-                print("SUCCESS: Change dispenser created")
-            
+        
+        # Exact payment: nothing for the hoppers to do, go straight to printing
+        if change_amount <= 0:
+            if _DEBUG:
+                print("SUCCESS: No change to dispense, proceeding to printing")
+            self._start_printing()
+            return True, "Payment processing started"
+        
+        if self.change_dispenser is None:
+            # close() has already released the hoppers
+            print("ERROR: Change dispenser is not available")
+            return False, "Change dispenser is not available"
+        
+        try:
             # Start dispensing change in a separate thread
-            if change_amount > 0:
+            if _DEBUG:
                 print(f"Starting change dispensing for P{change_amount:.2f}")
-                self.dispense_thread = DispenseThread(
-                    dispenser=self.change_dispenser,
-                    amount=change_amount,
-                    admin_screen=main_app.admin_screen,
-                    db_threader=main_app.db_threader
-                )
-                self.dispense_thread.status_update.connect(self.payment_status_updated.emit)
-                self.dispense_thread.dispensing_finished.connect(self._on_dispensing_finished)
-                self.dispense_thread.start()
-                print("SUCCESS: Dispense thread started")
-            else:
-                # No change to dispense, proceed directly to printing
-                print("SUCCESS: No change to dispense, proceeding to printing")
-                self._start_printing()
+            self.dispense_task = DispenseTask(
+                dispenser=self.change_dispenser,
+                amount=change_amount,
+                signals=self._dispense_signals,
+                admin_screen=main_app.admin_screen,
+                db_threader=main_app.db_threader
+            )
+            self._dispense_pool.start(self.dispense_task)
+            if _DEBUG:
+                print("SUCCESS: Dispense task started")
             
             return True, "Payment processing started"
             
-        except Exception as e:
-            print(f"ERROR: Error in payment completion: {e}")
-            # Reset payment completing flag on error
-            if hasattr(self, '_payment_completing'):
-                self._payment_completing = False
+        except (AttributeError, RuntimeError) as e:
+            # Missing main_app services, or the pool/dispenser is gone
+            print(f"ERROR: Error starting change dispensing: {e}")
             return False, f"Payment completion failed: {str(e)}"
     
     def _on_dispensing_finished(self, result):
         """Handle completion of change dispensing."""
-        print(f"Change dispensing finished: {result}")
+        if _DEBUG:
+            print(f"Change dispensing finished: {result}")
+        # Dispensing drew coins from the hoppers
+        self._invalidate_suggestions()
+        
+        # Reset payment completing flag
+        self._payment_completing = False
         
         try:
-            # Reset payment completing flag
-            if hasattr(self, '_payment_completing'):
-                self._payment_completing = False
-            
+            # Coins actually paid out (also after a partial failure). They are subtracted
+            # in the same commit that logs the transaction and adds the received cash
+            if result:
+                self.change_dispensed = {1: result.get('coins_1', 0), 5: result.get('coins_5', 0)}
             if result and result.get('success', False):
-                print("SUCCESS: Change dispensing successful")
-                # Start printing after change is dispensed
-                self._start_printing()
+                if _DEBUG:
+                    print("SUCCESS: Change dispensing successful")
             else:
                 print("ERROR: Change dispensing failed")
                 error_msg = result.get('error', 'Unknown error') if result else 'No result received'
-                self.payment_status_updated.emit(f"Change dispensing failed: {error_msg}")
-                # Still try to proceed to printing in case of minor dispensing issues
+                self._post_status(f"Change dispensing failed: {error_msg}")
+                # Still proceed to printing in case of minor dispensing issues
                 print("WARNING: Attempting to proceed to printing despite dispensing issues")
-                self._start_printing()
-        except Exception as e:
+        except AttributeError as e:
+            # result was not the dict DispenseTask emits
             print(f"ERROR: Error handling dispensing completion: {e}")
-            # Reset flag and try to proceed
-            if hasattr(self, '_payment_completing'):
-                self._payment_completing = False
-            self.payment_status_updated.emit(f"Error processing change: {str(e)}")
-            # Still try to proceed to printing
-            print("WARNING: Attempting to proceed to printing despite error")
+            self._post_status(f"Error processing change: {str(e)}")
+        finally:
+            # Printing starts exactly once, whatever happened while dispensing
             self._start_printing()
     
     def _start_printing(self):
-        """Start the printing process."""
-        print("Starting printing process...")
+        """Start the printing process (once per payment)."""
+        if self._printing_started:
+            return
+        self._printing_started = True
+        if _DEBUG:
+            print("Starting printing process...")
         
-        try:
-            # Validate payment data exists
-            if not hasattr(self, 'payment_data') or not self.payment_data:
-                print("ERROR: No payment data available for printing")
-                self.payment_status_updated.emit("No payment data available for printing")
-                return
-            
-            # Validate main app reference
-            if not hasattr(self, 'main_app') or not self.main_app:
-                print("ERROR: No main app reference for printing")
-                self.payment_status_updated.emit("No main app reference for printing")
-                return
-            
-            # Validate PDF data exists
-            if 'pdf_data' not in self.payment_data or not self.payment_data['pdf_data']:
-                print("ERROR: No PDF data available for printing")
-                self.payment_status_updated.emit("No PDF data available for printing")
-                return
-            
-            # Store print job details in main app for thank you screen
-            print_job_details = {
-                'file_path': self.payment_data['pdf_data']['path'],
-                'selected_pages': self.payment_data.get('selected_pages', [1]),
-                'copies': self.payment_data.get('copies', 1),
-                'color_mode': self.payment_data.get('color_mode', 'Color')
-            }
-            self.main_app.current_print_job = print_job_details
+        payment_data = self.payment_data
+        main_app = self.main_app
+        
+        # Validate payment data exists
+        if not payment_data:
+            print("ERROR: No payment data available for printing")
+            self._post_status("No payment data available for printing")
+            return
+        
+        # Validate main app reference
+        if main_app is None:
+            print("ERROR: No main app reference for printing")
+            self._post_status("No main app reference for printing")
+            return
+        
+        # Validate PDF data exists
+        pdf_data = payment_data.get('pdf_data')
+        if not pdf_data or 'path' not in pdf_data:
+            print("ERROR: No PDF data available for printing")
+            self._post_status("No PDF data available for printing")
+            return
+        
+        # Store print job details in main app for thank you screen
+        get = payment_data.get
+        print_job_details = {
+            'file_path': pdf_data['path'],
+            'selected_pages': get('selected_pages', [1]),
+            'copies': get('copies', 1),
+            'color_mode': get('color_mode', 'Color')
+        }
+        main_app.current_print_job = print_job_details
+        if _DEBUG:
             print(f"SUCCESS: Print job details stored: {print_job_details}")
-            
+        
+        try:
             # Navigate to thank you screen
             self._navigate_to_thank_you()
             
         except Exception as e:
             print(f"ERROR: Error starting printing: {e}")
-            self.payment_status_updated.emit(f"Printing error: {str(e)}")
+            self._post_status(f"Printing error: {str(e)}")
             # Try to navigate to thank you screen anyway
             try:
                 self._navigate_to_thank_you()
@@ -952,39 +1179,43 @@ class PaymentModel(QObject):
 
     def reset_payment_state(self):
         """Reset payment state for new transactions."""
-        print("Resetting payment state...")
+        if _DEBUG:
+            print("Resetting payment state...")
         
         try:
             # Reset payment completing flag
-            if hasattr(self, '_payment_completing'):
-                self._payment_completing = False
+            self._payment_completing = False
+            self._printing_started = False
             
             # Reset payment amounts
             self.amount_received = 0
             self.total_cost = 0
-            self.cash_received = {}
+            self.cash_received = _new_cash_counts()
+            self.change_dispensed = {}
             
             # Reset payment data
             self.payment_data = None
             
-            # Stop any running dispense thread
-            if hasattr(self, 'dispense_thread') and self.dispense_thread and self.dispense_thread.isRunning():
-                print("WARNING: Stopping dispense thread during reset")
-                self.dispense_thread.terminate()
-                self.dispense_thread.wait(1000)
-                self.dispense_thread = None
+            # Stop any running dispense task
+            if self.dispense_task is not None and self.dispense_task.is_running():
+                print("WARNING: Stopping dispense task during reset")
+                self._stop_dispense_task()
             
             # Reset payment ready state
             self.payment_ready = False
             
             # Emit reset signals
-            self.amount_received_updated.emit(0)
-            self.change_updated.emit(0, "")
-            self.payment_status_updated.emit("Payment screen ready")
+            emit_amount = self.amount_received_updated.emit
+            emit_status = self.payment_status_updated.emit
+            emit_amount(0)
+            self._emit_changed('change', self.change_updated, 0, "")
+            emit_status("Payment screen ready")
             
-            print("SUCCESS: Payment state reset complete")
+            if _DEBUG:
+                print("SUCCESS: Payment state reset complete")
             
-        except Exception as e:
+        except RuntimeError as e:
+            # Signals emitted after Qt has torn the screen down
             print(f"ERROR: Error resetting payment state: {e}")
 
     def go_back(self):
@@ -997,3 +1228,12 @@ class PaymentModel(QObject):
         self.on_leave()
         self.reset_payment_state()
         self.go_back_requested.emit()
+    
+    def close(self):
+        """Releases the change dispenser's hardware; called once at application shutdown."""
+        if self.dispense_task is not None:
+            self._stop_dispense_task()
+        self._dispense_pool.waitForDone(1000)
+        if self.change_dispenser is not None:
+            self.change_dispenser.cleanup()
+            self.change_dispenser = None
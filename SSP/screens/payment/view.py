@@ -1,10 +1,11 @@
 import os
+from functools import partial
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QFrame,
     QMessageBox, QScrollArea, QStackedLayout, QSizePolicy
 )
 from PyQt5.QtCore import Qt, pyqtSignal
-from PyQt5.QtGui import QPixmap
+from utils.background import apply_background
 
 try:
     import pigpio
@@ -12,6 +13,18 @@ try:
 except ImportError:
     PAYMENT_GPIO_AVAILABLE = False
 
+# Stylesheets are built once; the change label's is swapped on every insert
+_STYLE_CHANGE_PAID = "QLabel { color: #155724; font-size: 18px; font-weight: bold; padding: 10px; background-color: #d4edda; border-radius: 6px; }"
+_STYLE_CHANGE_REMAINING = "QLabel { color: #721c24; font-size: 18px; font-weight: bold; padding: 10px; background-color: #f8d7da; border-radius: 6px; }"
+_STYLE_BACK_BTN = (
+    "QPushButton { background-color: #1e440a; color: white; border: none; border-radius: 6px; font-size: 16px; font-weight: bold; padding: 12px 24px; } "
+    "QPushButton:hover { background-color: #2a5f10; }"
+)
+_STYLE_SIM_BTN = (
+    "QPushButton { background-color: #ffc107; color: black; border: none; border-radius: 4px; font-size: 12px; font-weight: bold; padding: 8px 12px; } "
+    "QPushButton:hover { background-color: #e0a800; }"
+)
+
 class PaymentScreenView(QWidget):
     """View for the Payment screen - handles UI components and presentation."""
     
@@ -21,12 +34,23 @@ class PaymentScreenView(QWidget):
     simulation_coin_clicked = pyqtSignal(int)  # coin_value
     simulation_bill_clicked = pyqtSignal(int)  # bill_value
     
+    _BG_PATH = os.path.abspath(os.path.join(
+        os.path.dirname(__file__), "..", "..", "assets", "payment_dialog_background.png"
+    ))
+    
     def __init__(self, parent=None):
         super().__init__(parent)
+        self._change_style = None  # last stylesheet applied to change_label
+        self._last_summary = None  # last PaymentSummary shown
+        self._last_amount = None  # last amount shown in amount_received_label
+        self._ui_built = False
         self.setup_ui()
     
     def setup_ui(self):
         """Sets up the user interface for the screen."""
+        # The view lives for the whole app; sessions only update its labels
+        assert not self._ui_built, "PaymentScreenView.setup_ui called twice"
+        self._ui_built = True
         stacked_layout = QStackedLayout()
         stacked_layout.setContentsMargins(0, 0, 0, 0)
         stacked_layout.setStackingMode(QStackedLayout.StackAll)
@@ -120,16 +144,8 @@ class PaymentScreenView(QWidget):
     
     def _load_background_image(self):
         """Loads the background image."""
-        assets_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "assets"))
-        image_filename = "payment_dialog_background.png"
-        abs_path = os.path.join(assets_dir, image_filename)
-
-        if os.path.exists(abs_path):
-            pixmap = QPixmap(abs_path)
-            self.background_label.setPixmap(pixmap)
-            self.background_label.setScaledContents(True)
-        else:
-            print("WARNING: Payment dialog background not found at:", abs_path)
+        if not apply_background(self.background_label, self._BG_PATH):
+            print("WARNING: Payment dialog background not found at:", self._BG_PATH)
             self.background_label.setStyleSheet("background-color: #1f1f38;")
     
     def _add_simulation_buttons(self, layout):
@@ -138,31 +154,42 @@ class PaymentScreenView(QWidget):
         sim_label.setStyleSheet("QLabel { font-size: 14px; font-weight: bold; color: #856404; background-color: #fff3cd; padding: 8px; border-radius: 4px; margin: 8px 0; }")
         layout.addWidget(sim_label)
         
-        sim_layout = QHBoxLayout()
+        # One stylesheet on the container is inherited by every button in it
+        sim_container = QWidget()
+        sim_container.setObjectName("simContainer")
+        sim_container.setStyleSheet(self.get_simulation_button_style())
+        sim_layout = QHBoxLayout(sim_container)
+        sim_layout.setContentsMargins(0, 0, 0, 0)
         sim_layout.setSpacing(10)
         
         for val in [1, 5, 10, 20, 50, 100]:
             btn = QPushButton(f"P{val}")
             btn.setMinimumHeight(35)
-            btn.setStyleSheet(self.get_simulation_button_style())
-            if val <= 10:
-                btn.clicked.connect(lambda _, v=val: self.simulation_coin_clicked.emit(v))
-            else:
-                btn.clicked.connect(lambda _, v=val: self.simulation_bill_clicked.emit(v))
+            signal = self.simulation_coin_clicked if val <= 10 else self.simulation_bill_clicked
+            btn.clicked.connect(partial(self._emit_simulated_cash, signal, val))
             sim_layout.addWidget(btn)
         
-        layout.addLayout(sim_layout)
+        layout.addWidget(sim_container)
+    
+    @staticmethod
+    def _emit_simulated_cash(signal, value, _checked=False):
+        """Slot target for the simulation buttons; takes clicked()'s bool so no adapter is needed."""
+        signal.emit(value)
     
     def update_payment_data(self, summary_data):
         """Updates the payment data display."""
-        self.total_label.setText(f"Total Amount Due: P{summary_data['total_cost']:.2f}")
+        # PaymentSummary is a frozen dataclass, so equality covers every field
+        if summary_data == self._last_summary:
+            return
+        self._last_summary = summary_data
+        self.total_label.setText(f"Total Amount Due: P{summary_data.total_cost:.2f}")
         
         summary_lines = [
             f"<b>Print Job Summary:</b>",
-            f"• Document: {summary_data['document_name']}",
-            f"• Copies: {summary_data['copies']}",
-            f"• Color Mode: {summary_data['color_mode']}",
-            f"• Breakdown: {summary_data['black_pages']} B&W pages, {summary_data['color_pages']} Color pages"
+            f"• Document: {summary_data.document_name}",
+            f"• Copies: {summary_data.copies}",
+            f"• Color Mode: {summary_data.color_mode}",
+            f"• Breakdown: {summary_data.black_pages} B&W pages, {summary_data.color_pages} Color pages"
         ]
         self.summary_label.setText("<br>".join(summary_lines))
     
@@ -172,21 +199,25 @@ class PaymentScreenView(QWidget):
     
     def update_amount_received(self, amount):
         """Updates the amount received display."""
+        if amount == self._last_amount:
+            return
+        self._last_amount = amount
         self.amount_received_label.setText(f"Amount Received: P{amount:.2f}")
     
     def update_change_display(self, change_amount, change_text):
         """Updates the change display."""
         self.change_label.setText(change_text)
         
-        if change_amount > 0:
-            # Payment complete with change
-            self.change_label.setStyleSheet("QLabel { color: #155724; font-size: 18px; font-weight: bold; padding: 10px; background-color: #d4edda; border-radius: 6px; }")
-        elif "Remaining" in change_text:
+        if change_amount <= 0 and "Remaining" in change_text:
             # Still need more payment
-            self.change_label.setStyleSheet("QLabel { color: #721c24; font-size: 18px; font-weight: bold; padding: 10px; background-color: #f8d7da; border-radius: 6px; }")
+            style = _STYLE_CHANGE_REMAINING
         else:
-            # Payment complete, no change
-            self.change_label.setStyleSheet("QLabel { color: #155724; font-size: 18px; font-weight: bold; padding: 10px; background-color: #d4edda; border-radius: 6px; }")
+            # Payment complete, with or without change
+            style = _STYLE_CHANGE_PAID
+        # Restyling re-polishes the label, so only do it when the style changes
+        if style is not self._change_style:
+            self.change_label.setStyleSheet(style)
+            self._change_style = style
     
     
     
@@ -196,17 +227,11 @@ class PaymentScreenView(QWidget):
     
     def get_back_button_style(self):
         """Returns the style for the back button."""
-        return (
-            "QPushButton { background-color: #1e440a; color: white; border: none; border-radius: 6px; font-size: 16px; font-weight: bold; padding: 12px 24px; } "
-            "QPushButton:hover { background-color: #2a5f10; }"
-        )
+        return _STYLE_BACK_BTN
     
     def get_simulation_button_style(self):
         """Returns the style for simulation buttons."""
-        return (
-            "QPushButton { background-color: #ffc107; color: black; border: none; border-radius: 4px; font-size: 12px; font-weight: bold; padding: 8px 12px; } "
-            "QPushButton:hover { background-color: #e0a800; }"
-        )
+        return _STYLE_SIM_BTN
     
     # removed popup suggestions style
 
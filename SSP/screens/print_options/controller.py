@@ -1,14 +1,20 @@
 # screens/print_options/controller.py
 
+import time
+
 from PyQt5.QtWidgets import QWidget, QGridLayout, QMessageBox
 from PyQt5.QtCore import QTimer
 
 from .model import PrintOptionsModel
 from .view import PrintOptionsScreenView
+from utils.debug import DEBUG as _DEBUG
 
 class PrintOptionsController(QWidget):
     """Manages the Print Options screen's logic and UI."""
     
+    PAPER_CHECK_DELAY_MS = 50
+    PAPER_COUNT_TTL = 0.5  # seconds
+    
     def __init__(self, main_app, parent=None):
         super().__init__(parent)
         self.main_app = main_app
@@ -21,6 +27,14 @@ class PrintOptionsController(QWidget):
         self.timeout_timer.setSingleShot(True)
         self.timeout_timer.timeout.connect(self._on_timeout)
         
+        # Collapses bursts of mode/copies clicks into one paper check
+        self._paper_check_timer = QTimer(self)
+        self._paper_check_timer.setSingleShot(True)
+        self._paper_check_timer.setInterval(self.PAPER_CHECK_DELAY_MS)
+        self._paper_check_timer.timeout.connect(self._do_paper_check)
+        # (monotonic time, paper count) of the last admin lookup
+        self._paper_count_cache = None
+        
         # Set the view's layout as this controller's layout
         self.setLayout(self.view.main_layout)
         
@@ -85,7 +99,8 @@ class PrintOptionsController(QWidget):
     
     def _on_analysis_completed(self, results):
         """Handles when analysis is completed."""
-        print("Analysis completed, enabling continue button and checking paper availability")
+        if _DEBUG:
+            print("Analysis completed, enabling continue button and checking paper availability")
         self.view.set_continue_button_enabled(True)
         # Check paper availability after analysis is complete with a small delay
         from PyQt5.QtCore import QTimer
@@ -121,7 +136,8 @@ class PrintOptionsController(QWidget):
     
     def _go_back(self):
         """Goes back to the file browser screen."""
-        print("Print options screen: going back to file browser")
+        if _DEBUG:
+            print("Print options screen: going back to file browser")
         self.on_leave()
         self.main_app.show_screen('file_browser')
     
@@ -177,50 +193,71 @@ class PrintOptionsController(QWidget):
             pass
 
     def _check_paper_availability(self):
+        """Schedules a paper check; repeated calls within the delay collapse into one."""
+        self._paper_check_timer.start()
+    
+    def _get_paper_count(self, admin_screen):
+        """Returns the admin paper count, reusing a lookup made within PAPER_COUNT_TTL."""
+        now = time.monotonic()
+        cache = self._paper_count_cache
+        if cache is not None and now - cache[0] < self.PAPER_COUNT_TTL:
+            return cache[1]
+        count = admin_screen.get_paper_count()
+        self._paper_count_cache = (now, count)
+        return count
+    
+    def _do_paper_check(self):
         """Checks if there's enough paper for the current print job."""
-        print("Paper check: Starting paper availability check...")
+        if _DEBUG:
+            print("Paper check: Starting paper availability check...")
         # Get current state from model even if payment data isn't ready
         selected_pages = getattr(self.model, 'selected_pages', None)
         copies = getattr(self.model, '_copies', 1)
         
         if not selected_pages:
-            print("Paper check: No selected pages available yet")
+            if _DEBUG:
+                print("Paper check: No selected pages available yet")
             return
         
         total_pages = len(selected_pages) * copies
         admin_screen = self.main_app.admin_screen
         
         if hasattr(admin_screen, 'get_paper_count'):
-            available_paper = admin_screen.get_paper_count()
-            print(f"Paper check: Available={available_paper}, Required={total_pages}")
-            print(f"Paper check: Admin screen type: {type(admin_screen)}")
+            available_paper = self._get_paper_count(admin_screen)
+            if _DEBUG:
+                print(f"Paper check: Available={available_paper}, Required={total_pages}")
+                print(f"Paper check: Admin screen type: {type(admin_screen)}")
             
             if available_paper < total_pages:
                 # Show warning and disable continue button
-                print(f"Paper check: Showing insufficient paper warning")
+                if _DEBUG:
+                    print(f"Paper check: Showing insufficient paper warning")
                 self.view.show_paper_warning(available_paper, total_pages)
             else:
                 # Clear any existing warning
-                print(f"Paper check: Sufficient paper available, clearing any warnings")
+                if _DEBUG:
+                    print(f"Paper check: Sufficient paper available, clearing any warnings")
                 self.view.clear_paper_warning()
         else:
             print("Paper check: Admin screen not available")
     
     def _calculate_max_change(self, cost):
         """Calculate maximum possible change needed for a transaction."""
-        next_bill = 20  # Assuming minimum bill is ₱20
-        while next_bill < cost:
-            next_bill += 20
+        # Smallest multiple of ₱20 (the minimum bill) covering the cost
+        next_bill = max(20, -(-cost // 20) * 20)
         return next_bill - cost
     
     def on_enter(self):
         """Called by main_app when this screen becomes active."""
-        print("Print options screen entered")
+        if _DEBUG:
+            print("Print options screen entered")
         # Ensure analysis thread is not running from previous visits
         self.model.stop_analysis()
         
         # Clear any existing paper warnings first
         self.view.clear_paper_warning()
+        # Paper may have been refilled since the last visit
+        self._paper_count_cache = None
         
         # Delay the supplies check slightly to ensure admin_screen is ready
         from PyQt5.QtCore import QTimer
@@ -230,14 +267,17 @@ class PrintOptionsController(QWidget):
         
         # Start timeout timer (1 minute)
         self.timeout_timer.start(60000)
-        print("⏰ Print options screen timeout started (1 minute)")
+        if _DEBUG:
+            print("⏰ Print options screen timeout started (1 minute)")
     
     def on_leave(self):
         """Called by main_app when leaving this screen."""
-        print("Print options screen leaving")
+        if _DEBUG:
+            print("Print options screen leaving")
         self.model.stop_analysis()
         # Stop timeout timer
         self.timeout_timer.stop()
+        self._paper_check_timer.stop()
     
     def _on_timeout(self):
         """Handle timeout - return to idle screen."""
@@ -246,6 +286,4 @@ class PrintOptionsController(QWidget):
     
     def _reset_timeout(self):
         """Reset the timeout timer (call on user activity)."""
-        self.timeout_timer.stop()
         self.timeout_timer.start(60000)
-        print("⏰ Print options screen timeout reset")
@@ -1,5 +1,6 @@
 # screens/print_options/model.py
 
+import os
 import fitz
 import cv2
 import numpy as np
@@ -118,6 +119,8 @@ class PrintOptionsModel(QObject):
         config = get_config()
         self.analyzer = PDFColorAnalyzer()  # Will use config values
         self.analysis_thread = None
+        # Stopped analysis threads still finishing in the background
+        self._retired_threads = set()
         self.analysis_results = None
         
         self.selected_pdf = None
@@ -174,9 +177,7 @@ class PrintOptionsModel(QObject):
             print(f"🔍 No selected PDF, returning")
             return
 
-        if self.analysis_thread and self.analysis_thread.isRunning():
-            self.analysis_thread.stop()
-            self.analysis_thread.wait()
+        self.stop_analysis()
 
         self.analysis_results = None
         user_wants_color = (self._color_mode == "Color")
@@ -189,6 +190,7 @@ class PrintOptionsModel(QObject):
             pdf_path = self.selected_pdf['path']
             self.analysis_thread = AnalysisThread(self.analyzer, pdf_path, self.selected_pages, user_wants_color)
             self.analysis_thread.analysis_complete.connect(self.on_analysis_finished)
+            self.analysis_thread.finished.connect(self._release_retired_thread)
             self.analysis_thread.start()
         else:
             # For black and white, calculate directly
@@ -211,6 +213,10 @@ class PrintOptionsModel(QObject):
     
     def on_analysis_finished(self, results):
         """Handles the completion of PDF analysis."""
+        sender = self.sender()
+        if sender is not None and sender is not self.analysis_thread:
+            # Result queued by a thread that was stopped before it got delivered
+            return
         if results.get('error'):
             self.analysis_error.emit(results['error'])
             return
@@ -250,9 +256,12 @@ class PrintOptionsModel(QObject):
             return None
         
         total_cost = self.analysis_results['pricing']['base_cost'] * self._copies
+        # A copy: selected_pdf is the file browser's dict, not ours to modify
+        pdf_data = {**self.selected_pdf, 'basename': os.path.basename(self.selected_pdf['path'])}
         return {
-            'pdf_data': self.selected_pdf,
+            'pdf_data': pdf_data,
             'selected_pages': self.selected_pages,
+            'page_count': len(self.selected_pages),
             'copies': self._copies,
             'color_mode': self._color_mode,
             'total_cost': total_cost,
@@ -260,10 +269,19 @@ class PrintOptionsModel(QObject):
         }
     
     def stop_analysis(self):
-        """Stops the current analysis thread."""
-        if self.analysis_thread and self.analysis_thread.isRunning():
-            self.analysis_thread.stop()
-            if not self.analysis_thread.wait(2000):
-                print("Warning: Analysis thread did not stop gracefully")
-                self.analysis_thread.terminate()
-                self.analysis_thread.wait(1000)
+        """Stops the current analysis thread without blocking the UI.
+
+        A page render can't be interrupted, so the thread is told to drop its
+        result and left to finish on its own. It is parked in _retired_threads
+        until finished so Qt never destroys it while it is still running.
+        """
+        thread = self.analysis_thread
+        if thread is None or not thread.isRunning():
+            return
+        self.analysis_thread = None
+        thread.stop()
+        self._retired_threads.add(thread)
+    
+    def _release_retired_thread(self):
+        """Drops the last reference to a stopped analysis thread once it has finished."""
+        self._retired_threads.discard(self.sender())
@@ -2,6 +2,7 @@ from PyQt5.QtWidgets import QWidget, QDialog
 from .model import ThankYouModel
 from .view import ThankYouScreenView
 from screens.dialogs.pin_dialog import PinDialogController as PinDialog
+from utils.debug import DEBUG as _DEBUG
 
 class ThankYouController(QWidget):
     """Controller for the Thank You screen - coordinates between model and view."""
@@ -75,21 +76,25 @@ class ThankYouController(QWidget):
     
     def _show_admin_override_button(self):
         """Shows the admin override button when an error occurs."""
-        print("Thank you screen: Showing admin override button")
+        if _DEBUG:
+            print("Thank you screen: Showing admin override button")
         self.view.show_admin_override_button()
     
     def _hide_admin_override_button(self):
         """Hides the admin override button when error is resolved."""
-        print("Thank you screen: Hiding admin override button")
+        if _DEBUG:
+            print("Thank you screen: Hiding admin override button")
         self.view.hide_admin_override_button()
     
     def _handle_admin_override(self):
         """Handles admin override button click - shows PIN dialog."""
-        print("Thank you screen: Admin override button clicked")
+        if _DEBUG:
+            print("Thank you screen: Admin override button clicked")
         dialog = PinDialog(self)
         result = dialog.exec_()
         if result == QDialog.Accepted:
-            print("Thank you screen: PIN accepted, processing admin override")
+            if _DEBUG:
+                print("Thank you screen: PIN accepted, processing admin override")
             self.model.handle_admin_override()
-        else:
+        elif _DEBUG:
             print("Thank you screen: PIN dialog cancelled or failed")
@@ -54,6 +54,8 @@ class ThankYouModel(QObject):
         self.current_state = "initial"
         self.print_job_started = False
         self.error_type = None
+        # Set on the first on_enter
+        self.main_app = None
         
     def _on_timer_timeout(self):
         """Handle redirect timer timeout."""
@@ -77,7 +79,7 @@ class ThankYouModel(QObject):
             return
         
         # Check if there's a valid print job to start
-        if not hasattr(main_app, 'current_print_job') or not main_app.current_print_job:
+        if not main_app.current_print_job:
             print(f"DEBUG: No valid print job available, skipping print start")
             return
         
@@ -93,7 +95,7 @@ class ThankYouModel(QObject):
         self.admin_override_hidden.emit()
         
         # Connect to printer manager signals
-        if hasattr(main_app, 'printer_manager'):
+        if main_app.printer_manager is not None:
             print(f"DEBUG: Connecting to printer manager signals")
             try:
                 main_app.printer_manager.print_job_successful.connect(self._on_print_success)
@@ -243,7 +245,7 @@ class ThankYouModel(QObject):
         # Hide admin override button since override is being processed
         self.admin_override_hidden.emit()
         # Navigate directly to admin screen
-        if hasattr(self, 'main_app') and self.main_app:
+        if self.main_app is not None:
             self.main_app.show_screen('admin')
     
     def _on_print_success(self):
@@ -252,9 +254,6 @@ class ThankYouModel(QObject):
         if self.redirect_timer.isActive():
             self.redirect_timer.stop()
         
-        if hasattr(self, 'warning_timer') and self.warning_timer.isActive():
-            self.warning_timer.stop()
-        
         if self.status_check_timer.isActive():
             self.status_check_timer.stop()
         
@@ -309,14 +308,9 @@ class ThankYouModel(QObject):
             main_app: Main application window with current_print_job attribute
         """
         print(f"DEBUG: _start_print_job called")
-        print(f"DEBUG: main_app has current_print_job: {hasattr(main_app, 'current_print_job')}")
-        if hasattr(main_app, 'current_print_job'):
-            print(f"DEBUG: current_print_job value: {main_app.current_print_job}")
-        else:
-            print(f"DEBUG: current_print_job attribute does not exist")
-            print(f"DEBUG: main_app attributes: {[attr for attr in dir(main_app) if not attr.startswith('_')]}")
+        print(f"DEBUG: current_print_job value: {main_app.current_print_job}")
         
-        if hasattr(main_app, 'current_print_job') and main_app.current_print_job:
+        if main_app.current_print_job:
             try:
                 print(f"DEBUG: Starting print job with details: {main_app.current_print_job}")
                 main_app.printer_manager.print_file(
@@ -430,7 +424,7 @@ class ThankYouModel(QObject):
     def on_leave(self):
         """Called when the screen is hidden - cleanup connections and timers."""
         # Disconnect printer signals
-        if hasattr(self, 'main_app') and hasattr(self.main_app, 'printer_manager'):
+        if self.main_app is not None:
             try:
                 self.main_app.printer_manager.print_job_successful.disconnect(self._on_print_success)
                 self.main_app.printer_manager.print_job_failed.disconnect(self._on_print_failed)
@@ -1,7 +1,7 @@
 import os
 from PyQt5.QtWidgets import QWidget, QVBoxLayout, QLabel, QPushButton, QStackedLayout, QHBoxLayout
 from PyQt5.QtCore import Qt, pyqtSignal
-from PyQt5.QtGui import QPixmap
+from utils.background import apply_background
 
 def get_base_dir():
     """Gets the base directory of the project."""
@@ -14,6 +14,8 @@ class ThankYouScreenView(QWidget):
     finish_button_clicked = pyqtSignal()
     admin_override_clicked = pyqtSignal()
     
+    _BG_PATH = os.path.join(get_base_dir(), 'assets', 'thank_you_background.png')
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setup_ui()
@@ -82,14 +84,8 @@ class ThankYouScreenView(QWidget):
     
     def _load_background_image(self):
         """Loads the background image."""
-        base_dir = get_base_dir()
-        image_path = os.path.join(base_dir, 'assets', 'thank_you_background.png')
-        if os.path.exists(image_path):
-            pixmap = QPixmap(image_path)
-            self.background_label.setPixmap(pixmap)
-            self.background_label.setScaledContents(True)
-        else:
-            print(f"WARNING: Background image not found at '{image_path}'.")
+        if not apply_background(self.background_label, self._BG_PATH):
+            print(f"WARNING: Background image not found at '{self._BG_PATH}'.")
             self.background_label.setStyleSheet("background-color: #1f1f38;")
     
     def update_status(self, status_text, subtitle_text, status_style):
@@ -95,9 +95,7 @@ class USBController(QWidget):
     
     def _reset_timeout(self):
         """Reset the timeout timer (call on user activity)."""
-        self.timeout_timer.stop()
         self.timeout_timer.start(60000)
-        print("⏰ USB screen timeout reset")
     
     def reset_usb_state(self):
         """Public method to reset USB monitoring state."""
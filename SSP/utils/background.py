@@ -0,0 +1,45 @@
+"""
+Shared loading of full-screen background images.
+
+Each image is decoded and scaled to the primary screen once per process,
+then reused by every view that shows it.
+"""
+
+import os
+from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QPixmap
+from PyQt5.QtWidgets import QApplication, QSizePolicy
+
+# path -> screen-sized QPixmap, or None when the file is missing
+_pixmap_cache = {}
+
+def get_background_pixmap(path):
+    """Return the image at path scaled to the screen, or None if it is missing."""
+    if path not in _pixmap_cache:
+        pixmap = None
+        if os.path.exists(path):
+            pixmap = QPixmap(path)
+            screen = QApplication.primaryScreen()
+            if screen is not None:
+                # Scaled once so painting the label is a plain blit
+                pixmap = pixmap.scaled(
+                    screen.size(), Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation
+                )
+        _pixmap_cache[path] = pixmap
+    return _pixmap_cache[path]
+
+def apply_background(label, path):
+    """
+    Show the background image at path on label.
+
+    Returns:
+        False if the image file is missing, True otherwise.
+    """
+    pixmap = get_background_pixmap(path)
+    if pixmap is None:
+        return False
+    label.setPixmap(pixmap)
+    label.setAlignment(Qt.AlignCenter)
+    # The pixmap may overhang the screen; keep it from setting the minimum size
+    label.setSizePolicy(QSizePolicy.Ignored, QSizePolicy.Ignored)
+    return True
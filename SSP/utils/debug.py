@@ -0,0 +1,10 @@
+"""
+Verbose tracing switch.
+
+Set SSP_DEBUG=1 in the environment to enable the DEBUG prints across the
+screens and managers. The variable is read once, at import.
+"""
+
+import os
+
+DEBUG = os.environ.get('SSP_DEBUG') == '1'